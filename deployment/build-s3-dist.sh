@@ -68,13 +68,15 @@ echo "--------------------------------------------------------------------------
 echo "cd $source_dir"
 cd $source_dir
 
-# setup lambda layers (building sagemaker layer using lambda build environment for python 3.10)
-echo 'docker run --entrypoint /bin/bash -v "$source_dir"/infrastructure/lib/blueprints/lambdas/sagemaker_layer:/var/task public.ecr.aws/lambda/python:3.10 -c "cat requirements.txt; pip3 install -r requirements.txt -t ./python; exit"'
-docker run --entrypoint /bin/bash -v "$source_dir"/infrastructure/lib/blueprints/lambdas/sagemaker_layer:/var/task public.ecr.aws/lambda/python:3.10 -c "cat requirements.txt; pip3 install -r requirements.txt -t ./python; exit"
+# setup lambda layers (building sagemaker layer using lambda build environment for python 3.12)
+echo 'docker run --entrypoint /bin/bash -v "$source_dir"/infrastructure/lib/blueprints/lambdas/sagemaker_layer:/var/task public.ecr.aws/lambda/python:3.12 -c "cat requirements.txt; pip3 install -r requirements.txt -t ./python --prefer-binary --no-compile; exit"'
+docker run --entrypoint /bin/bash -v "$source_dir"/infrastructure/lib/blueprints/lambdas/sagemaker_layer:/var/task public.ecr.aws/lambda/python:3.12 -c "cat requirements.txt; pip3 install -r requirements.txt -t ./python --prefer-binary --no-compile; exit"
 
 # Remove tests and cache stuff (to reduce size)
 find "$source_dir"/infrastructure/lib/blueprints/lambdas/sagemaker_layer/python -type d -name "tests" -exec rm -rfv {} +
 find "$source_dir"/infrastructure/lib/blueprints/lambdas/sagemaker_layer/python -type d -name "__pycache__" -exec rm -rfv {} +
+find "$source_dir"/infrastructure/lib/blueprints/lambdas/sagemaker_layer/python -type f -name "*.pyc" -delete
+find "$source_dir"/infrastructure/lib/blueprints/lambdas/sagemaker_layer/python -path "*.dist-info/RECORD" -delete
 
 echo "python3 -m venv .venv-prod"
 python3 -m venv .venv-prod
@@ -342,9 +344,19 @@ for lambda in `find . -mindepth 1 -maxdepth 1 -type d`; do
 
     cd $lambda_dir_name
 
+    # the zip file's name includes the hash of its content, the same one the templates reference
+    # (see blueprint_lambda_key in deploy_actions.py, computed from the source tree packaged here)
+    zip_file_name=`cd $source_dir/infrastructure && python3 -c "from lib.blueprints.pipeline_definitions.deploy_actions import blueprint_lambda_key; print(blueprint_lambda_key('$lambda_dir_name'))" | xargs basename -s .zip`
+    echo "zip_file_name=$zip_file_name"
+
+    # Removing files that are not used at runtime (to reduce the zip file's size)
+    find . -type d \( -name "tests" -o -name "__pycache__" -o -name "*.egg-info" \) -prune -exec rm -rf {} +
+    find . -type f -name "*.pyc" -delete
+    rm -f setup.py requirements.txt requirements-test.txt .coveragerc
+
     # Creating the zip file for each lambda
-    echo "zip -r9 ../$lambda_dir_name.zip *"
-    zip -r9 ../$lambda_dir_name.zip *
+    echo "zip -r9 ../$zip_file_name.zip *"
+    zip -r9 ../$zip_file_name.zip *
     cd ..
 
     # Removing the lambda directories after creating zip files of them
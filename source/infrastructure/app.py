@@ -36,6 +36,9 @@ from lib.blueprints.ml_pipelines.model_training_pipeline import (
 from lib.blueprints.aspects.aws_sdk_config_aspect import AwsSDKConfigAspect
 from lib.blueprints.aspects.protobuf_config_aspect import ProtobufConfigAspect
 from lib.blueprints.aspects.app_registry_aspect import AppRegistry
+from lib.blueprints.aspects.lambda_policies_suppression_aspect import (
+    LambdaPoliciesSuppression,
+)
 from lib.blueprints.pipeline_definitions.cdk_context_value import (
     get_cdk_context_value,
 )
@@ -451,4 +454,7 @@ Aspects.of(multi_account_codepipeline).add(
     )
 )
 
+# add the cfn_nag lambda suppressions to the Lambda functions of all the stacks
+Aspects.of(app).add(LambdaPoliciesSuppression())
+
 app.synth()
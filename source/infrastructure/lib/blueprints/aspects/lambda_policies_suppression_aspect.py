@@ -0,0 +1,26 @@
+# #####################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                            #
+#                                                                                                                     #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance     #
+#  with the License. A copy of the License is located at                                                              #
+#                                                                                                                     #
+#  http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                     #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES  #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
+#  and limitations under the License.                                                                                 #
+# #####################################################################################################################
+import jsii
+from constructs import IConstruct
+from aws_cdk import IAspect
+from aws_cdk.aws_lambda import CfnFunction
+from lib.blueprints.pipeline_definitions.helpers import suppress_lambda_policies
+
+
+@jsii.implements(IAspect)
+class LambdaPoliciesSuppression:
+    """Adds the cfn_nag lambda suppressions to the functions that do not have their own metadata"""
+
+    def visit(self, node: IConstruct):
+        if isinstance(node, CfnFunction) and not node.cfn_options.metadata:
+            node.cfn_options.metadata = suppress_lambda_policies()
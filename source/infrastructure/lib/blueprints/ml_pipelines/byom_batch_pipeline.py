@@ -49,6 +49,7 @@ class BYOMBatchStack(Stack):
         batch_job_output_location = pf.create_batch_job_output_location_parameter(self)
         model_package_group_name = pf.create_model_package_group_name_parameter(self)
         model_package_name = pf.create_model_package_name_parameter(self)
+        lambda_memory_size = pf.create_lambda_memory_size_parameter(self)
 
         # Conditions
         custom_algorithms_ecr_repo_arn_provided = (
@@ -120,6 +121,7 @@ class BYOMBatchStack(Stack):
                 Aws.NO_VALUE,
             ).to_string(),
             sm_layer,
+            memory_size=lambda_memory_size.value_as_number,
         )
 
         # create custom resource to invoke the batch transform lambda
@@ -87,6 +87,7 @@ class ModelMonitorStack(Stack):
         )
         self.schedule_expression = pf.create_schedule_expression_parameter(self)
         self.image_uri = pf.create_algorithm_image_uri_parameter(self)
+        self.lambda_memory_size = pf.create_lambda_memory_size_parameter(self)
 
         # common conditions
         self.kms_key_arn_provided = cf.create_kms_key_arn_provided_condition(
@@ -193,6 +194,7 @@ class ModelMonitorStack(Stack):
             blueprint_bucket=self.blueprint_bucket,
             assets_bucket=self.assets_bucket,
             sm_layer=sm_layer,
+            memory_size=self.lambda_memory_size.value_as_number,
             **self.baseline_attributes,
         )
 
@@ -89,6 +89,11 @@ class MultiAccountCodePipelineStack(Stack):
         delegated_admin_account_condition = cf.create_delegated_admin_condition(
             self, is_delegated_admin
         )
+        # provisioned concurrency of the StackSet lambda functions
+        provisioned_concurrency = pf.create_provisioned_concurrency_parameter(self)
+        provisioned_concurrency_condition = cf.create_provisioned_concurrency_condition(
+            self, provisioned_concurrency
+        )
 
         # Resources #
         assets_bucket = s3.Bucket.from_bucket_name(
@@ -134,6 +139,7 @@ class MultiAccountCodePipelineStack(Stack):
             [Aws.REGION],
             f"{stack_name.value_as_string}-dev-{unique_id}",
             delegated_admin_account_condition,
+            provisioned_concurrency_condition,
         )
 
         # DeployStaging manual approval
@@ -157,6 +163,7 @@ class MultiAccountCodePipelineStack(Stack):
             [Aws.REGION],
             f"{stack_name.value_as_string}-staging-{unique_id}",
             delegated_admin_account_condition,
+            provisioned_concurrency_condition,
         )
 
         # DeployProd manual approval
@@ -180,6 +187,7 @@ class MultiAccountCodePipelineStack(Stack):
             [Aws.REGION],
             f"{stack_name.value_as_string}-prod-{unique_id}",
             delegated_admin_account_condition,
+            provisioned_concurrency_condition,
         )
 
         # create invoking lambda policy
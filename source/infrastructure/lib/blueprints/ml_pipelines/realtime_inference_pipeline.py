@@ -38,7 +38,10 @@ from lib.blueprints.pipeline_definitions.sagemaker_endpoint_config import (
 from lib.blueprints.pipeline_definitions.sagemaker_endpoint import (
     create_sagemaker_endpoint,
 )
-from lib.blueprints.pipeline_definitions.helpers import suppress_lambda_policies
+from lib.blueprints.pipeline_definitions.deploy_actions import (
+    lambda_runtime,
+    blueprint_lambda_key,
+)
 from lib.blueprints.pipeline_definitions.templates_parameters import (
     ParameteresFactory as pf,
     ConditionsFactory as cf,
@@ -93,10 +96,10 @@ class BYOMRealtimePipelineStack(Stack):
             self,
             "BYOMInference",
             lambda_function_props={
-                "runtime": lambda_.Runtime.PYTHON_3_10,
+                "runtime": lambda_runtime,
                 "handler": "main.handler",
                 "code": lambda_.Code.from_bucket(
-                    blueprint_bucket, "blueprints/lambdas/inference.zip"
+                    blueprint_bucket, blueprint_lambda_key("inference")
                 ),
                 "timeout": Duration.minutes(5),
             },
@@ -108,10 +111,6 @@ class BYOMRealtimePipelineStack(Stack):
                 "proxy": False,
             },
         )
-        # add suppressions
-        inference_api_gateway.lambda_function.node.default_child.cfn_options.metadata = (
-            suppress_lambda_policies()
-        )
         provision_resource = inference_api_gateway.api_gateway.root.add_resource(
             "inference"
         )
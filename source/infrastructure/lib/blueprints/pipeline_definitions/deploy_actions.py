@@ -10,7 +10,11 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
-from aws_cdk import Aws, Aspects, Duration, Fn, CustomResource, CfnCapabilities
+import functools
+import hashlib
+import os
+from constructs import Construct
+from aws_cdk import Aws, Duration, Fn, Token, CustomResource, CfnCapabilities
 from aws_cdk import (
     aws_iam as iam,
     aws_lambda as lambda_,
@@ -20,11 +24,9 @@ from aws_cdk import (
     aws_events_targets as targets,
 )
 from lib.blueprints.pipeline_definitions.helpers import (
-    suppress_lambda_policies,
     suppress_pipeline_policy,
     add_logs_policy,
 )
-from lib.blueprints.aspects.conditional_resource import ConditionalResources
 from lib.blueprints.pipeline_definitions.cdk_context_value import (
     get_cdk_context_value,
 )
@@ -45,30 +47,121 @@ from lib.blueprints.pipeline_definitions.iam_policies import (
     autopilot_job_endpoint_policy,
     training_job_policy,
     sagemaker_tags_policy_statement,
+    PolicyBuilder,
 )
 
 
 lambda_service = "lambda.amazonaws.com"
 lambda_handler = "main.handler"
+# the pinned aws-cdk-lib version predates the Runtime.PYTHON_3_11/PYTHON_3_12 constants
+lambda_runtime = lambda_.Runtime("python3.12", lambda_.RuntimeFamily.PYTHON)
+# the sagemaker layer is built in the python3.12 image, so its compiled wheels only load under python3.12
+layer_compatible_runtimes = [lambda_runtime]
+# the lambda functions get one vCPU at 1769 MB (CPU is allocated in proportion to memory)
+lambda_memory_size = 1769
+# alias of the published version invoked by the StackSet actions (instead of $LATEST)
+lambda_alias_name = "live"
+# the blueprint lambdas' directories, and the shared code the build script copies into each lambda's zip file
+blueprint_lambdas_dir = os.path.join(os.path.dirname(__file__), "..", "lambdas")
+shared_code_dir = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "..",
+    "..",
+    "lambdas",
+    "pipeline_orchestration",
+    "shared",
+)
+# files the build script removes from the lambdas' directories before zipping them
+lambda_build_files = (
+    "setup.py",
+    "requirements.txt",
+    "requirements-test.txt",
+    ".coveragerc",
+)
+
+
+def _bucket_arns(bucket):
+    """
+    _bucket_arns returns the ARNs of a bucket and its objects, to be used in the S3 policies
+
+    :bucket: CDK S3 bucket object
+    :return: tuple of the bucket's ARN and its objects' ARN
+    """
+    return bucket.bucket_arn, bucket.arn_for_objects("*")
+
+
+@functools.lru_cache(maxsize=None)
+def blueprint_lambda_key(lambda_name):
+    """
+    blueprint_lambda_key returns the S3 key of a blueprint lambda's (or layer's) zip file in the blueprint bucket.
+    The key includes a hash of the files packaged in the zip file: the lambda's directory (including the built
+    python/ directory of the sagemaker layer, and the installed dependencies) and the shared code. The build script
+    names the zip file with this function too, so a new function/layer version is published when, and only when,
+    the packaged code changes.
+
+    :lambda_name: name of the lambda's directory in lib/blueprints/lambdas (str)
+    :return: S3 key of the lambda's zip file (str)
+    """
+    digest = hashlib.sha256()
+    lambda_dir = os.path.join(blueprint_lambdas_dir, lambda_name)
+    for root_dir in [lambda_dir, shared_code_dir]:
+        for dir_path, dir_names, file_names in os.walk(root_dir):
+            # walk in a stable order, and skip the files that are not packaged (or change between runs)
+            dir_names[:] = sorted(d for d in dir_names if not _is_unpackaged(d))
+            for file_name in sorted(f for f in file_names if not _is_unpackaged(f)):
+                if dir_path == lambda_dir and file_name in lambda_build_files:
+                    continue
+                file_path = os.path.join(dir_path, file_name)
+                digest.update(os.path.relpath(file_path, root_dir).encode())
+                with open(file_path, "rb") as f:
+                    digest.update(f.read())
+
+    return f"blueprints/lambdas/{lambda_name}.{digest.hexdigest()[:12]}.zip"
+
+
+def _is_unpackaged(name):
+    # hidden files/directories, tests and python caches are not packaged in the zip files
+    return (
+        name.startswith(".")
+        or name in ("__pycache__", "tests")
+        or name.endswith((".pyc", ".egg-info"))
+    )
+
+
+def blueprint_lambda_keys():
+    """
+    blueprint_lambda_keys returns the S3 keys of all the blueprint lambdas' (and layers') zip files
+
+    :return: list of S3 keys (str)
+    """
+    return [
+        blueprint_lambda_key(lambda_name)
+        for lambda_name in sorted(os.listdir(blueprint_lambdas_dir))
+        if os.path.isdir(os.path.join(blueprint_lambdas_dir, lambda_name))
+        and not _is_unpackaged(lambda_name)
+    ]
 
 
 def sagemaker_layer(scope, blueprint_bucket):
     """
     sagemaker_layer creates a Lambda layer with Sagemaker SDK installed in it to allow Lambda functions call
-    Sagemaker SDK's methods such as create_model(), etc.
+    Sagemaker SDK's methods such as create_model(), etc. The layer is created once per scope, so pipelines
+    created in the same scope (e.g., the stack) share it.
 
     :blueprint_bucket: CDK object of the blueprint bucket that contains resources for BYOM pipeline
     :scope: CDK Construct scope that's needed to create CDK resources
     :return: Lambda layer version in a form of a CDK object
     """
     # Lambda sagemaker layer for sagemaker sdk that is used in create sagemaker model step
-    return lambda_.LayerVersion(
+    return scope.node.try_find_child("sagemakerlayer") or lambda_.LayerVersion(
         scope,
         "sagemakerlayer",
         code=lambda_.Code.from_bucket(
-            blueprint_bucket, "blueprints/lambdas/sagemaker_layer.zip"
+            blueprint_bucket, blueprint_lambda_key("sagemaker_layer")
         ),
-        compatible_runtimes=[lambda_.Runtime.PYTHON_3_9, lambda_.Runtime.PYTHON_3_10],
+        compatible_runtimes=layer_compatible_runtimes,
     )
 
 
@@ -84,6 +177,7 @@ def batch_transform(
     batch_job_output_location,
     kms_key_arn,
     sm_layer,
+    memory_size=lambda_memory_size,
 ):
     """
     batch_transform creates a sagemaker batch transform job in a lambda
@@ -100,29 +194,26 @@ def batch_transform(
     :batch_job_output_location: S3 bucket location where the result of the batch job will be stored
     :kms_key_arn: optional kmsKeyArn used to encrypt job's output and instance volume.
     :sm_layer: sagemaker lambda layer
+    :memory_size: memory (MB) of the lambda function, which also sets its CPU share. It can be a
+    CfnParameter's value_as_number, to be tuned when the stack is deployed or updated (default: 1769, i.e., one vCPU)
     :return: Lambda function
     """
-    s3_read = s3_policy_read(
-        list(
-            set(
-                [
-                    f"arn:{Aws.PARTITION}:s3:::{assets_bucket.bucket_name}",
-                    f"arn:{Aws.PARTITION}:s3:::{assets_bucket.bucket_name}/*",
-                    f"arn:{Aws.PARTITION}:s3:::{batch_input_bucket}",
-                    f"arn:{Aws.PARTITION}:s3:::{batch_inference_data}",
-                ]
-            )
-        )
-    )
-
-    s3_write = s3_policy_write(
-        [
-            f"arn:{Aws.PARTITION}:s3:::{batch_job_output_location}/*",
-        ]
+    lambda_policy = PolicyBuilder(
+        batch_transform_policy(),
+        s3_policy_read(
+            [
+                *_bucket_arns(assets_bucket),
+                f"arn:{Aws.PARTITION}:s3:::{batch_input_bucket}",
+                f"arn:{Aws.PARTITION}:s3:::{batch_inference_data}",
+            ]
+        ),
+        s3_policy_write(
+            [
+                f"arn:{Aws.PARTITION}:s3:::{batch_job_output_location}/*",
+            ]
+        ),
     )
 
-    batch_transform_permissions = batch_transform_policy()
-
     lambda_role = create_service_role(
         scope,
         "batch_transform_lambda_role",
@@ -133,21 +224,21 @@ def batch_transform(
         ),
     )
 
-    lambda_role.add_to_policy(batch_transform_permissions)
-    lambda_role.add_to_policy(s3_read)
-    lambda_role.add_to_policy(s3_write)
-    add_logs_policy(lambda_role)
+    lambda_policy.attach_to_role(lambda_role)
+    logs_policy = add_logs_policy(lambda_role)
 
     batch_transform_lambda = lambda_.Function(
         scope,
         id,
-        runtime=lambda_.Runtime.PYTHON_3_10,
+        runtime=lambda_runtime,
         handler=lambda_handler,
         layers=[sm_layer],
         role=lambda_role,
         code=lambda_.Code.from_bucket(
-            blueprint_bucket, "blueprints/lambdas/batch_transform.zip"
+            blueprint_bucket, blueprint_lambda_key("batch_transform")
         ),
+        memory_size=memory_size,
+        timeout=Duration.minutes(5),
         environment={
             "model_name": model_name,
             "inference_instance": inference_instance,
@@ -158,10 +249,8 @@ def batch_transform(
             "LOG_LEVEL": "INFO",
         },
     )
-
-    batch_transform_lambda.node.default_child.cfn_options.metadata = (
-        suppress_lambda_policies()
-    )
+    # the function is invoked during the stack deployment, so it needs its logs permissions in place
+    batch_transform_lambda.node.add_dependency(logs_policy)
 
     return batch_transform_lambda
 
@@ -192,6 +281,7 @@ def create_baseline_job_lambda(
     bias_config=None,
     shap_config=None,
     model_scores=None,
+    memory_size=lambda_memory_size,
 ):
     """
     create_baseline_job_lambda creates a data/model baseline processing job in a lambda invoked codepipeline action
@@ -228,12 +318,13 @@ def create_baseline_job_lambda(
     :shap_config: Config of the Shap explainability. Used by ModelExplainability monitor
     :model_scores: Index or JSONPath location in the model output for the predicted scores to be explained.
         This is not required if the model output is a single s
-    :return: codepipeline action in a form of a CDK object that can be attached to a codepipeline stage
+    :memory_size: memory (MB) of the lambda function, which also sets its CPU share. It can be a
+        CfnParameter's value_as_number, to be tuned when the stack is deployed or updated (default: 1769, i.e., one vCPU)
+    :return: Lambda function
     """
     s3_read = s3_policy_read(
         [
-            f"arn:{Aws.PARTITION}:s3:::{assets_bucket.bucket_name}",
-            f"arn:{Aws.PARTITION}:s3:::{assets_bucket.bucket_name}/*",  # give access to files used by different monitors
+            *_bucket_arns(assets_bucket),  # give access to files used by different monitors
             f"arn:{Aws.PARTITION}:s3:::{baseline_output_bucket}",
             f"arn:{Aws.PARTITION}:s3:::{baseline_output_bucket}/*",
         ]
@@ -252,8 +343,8 @@ def create_baseline_job_lambda(
 
     # Kms Key permissions
     kms_policy = kms_policy_document(scope, "BaselineKmsPolicy", kms_key_arn)
-    # add conditions to KMS and ECR policies
-    Aspects.of(kms_policy).add(ConditionalResources(kms_key_arn_provided_condition))
+    # create the KMS policy only if a kms key arn is provided
+    kms_policy.node.default_child.cfn_options.condition = kms_key_arn_provided_condition
 
     # sagemaker tags permissions
     sagemaker_tags_policy = sagemaker_tags_policy_statement()
@@ -268,13 +359,6 @@ def create_baseline_job_lambda(
     # attach the conditional policies
     kms_policy.attach_to_role(sagemaker_role)
 
-    # create a trust relation to assume the Role
-    sagemaker_role.add_to_policy(
-        iam.PolicyStatement(
-            actions=["sts:AssumeRole"],  # NOSONAR: repeated for clarity
-            resources=[sagemaker_role.role_arn],  # NOSONAR: repeated for clarity
-        )
-    )
     # creating a role so that this lambda can create a baseline job
     lambda_role = create_service_role(
         scope,
@@ -284,36 +368,45 @@ def create_baseline_job_lambda(
     )
 
     sagemaker_logs_policy.attach_to_role(sagemaker_role)
-    sagemaker_role.add_to_policy(create_baseline_job_policy)
-    sagemaker_role.add_to_policy(sagemaker_tags_policy)
+
+    # collect the roles' statements, so the ones only differing in resources are merged
+    sagemaker_policy = PolicyBuilder(
+        create_baseline_job_policy,
+        sagemaker_tags_policy,
+    )
+    lambda_policy = PolicyBuilder()
     # add extra permissions for "ModelBias", "ModelExplainability" baselines
     if monitoring_type in ["ModelBias", "ModelExplainability"]:
-        lambda_role.add_to_policy(baseline_lambda_get_model_name_policy(endpoint_name))
-        sagemaker_role.add_to_policy(
-            baseline_lambda_get_model_name_policy(endpoint_name)
-        )
-        sagemaker_role.add_to_policy(
-            sagemaker_model_bias_explainability_baseline_job_policy()
+        lambda_policy.add(baseline_lambda_get_model_name_policy(endpoint_name))
+        sagemaker_policy.add(
+            baseline_lambda_get_model_name_policy(endpoint_name),
+            sagemaker_model_bias_explainability_baseline_job_policy(),
         )
-    sagemaker_role.add_to_policy(s3_read)
-    sagemaker_role.add_to_policy(s3_write)
+    sagemaker_policy.add(s3_read, s3_write)
+    # attach the role's statements as one policy
+    sagemaker_role_policy = sagemaker_policy.create_policy(
+        scope, f"{sagemaker_role.node.id}Policy", sagemaker_role
+    )
 
     # add suppression
-    sagemaker_role.node.find_child(
-        "DefaultPolicy"
-    ).node.default_child.cfn_options.metadata = suppress_pipeline_policy()
+    sagemaker_role_policy.node.default_child.cfn_options.metadata = (
+        suppress_pipeline_policy()
+    )
 
-    lambda_role.add_to_policy(
+    lambda_policy.add(
         iam.PolicyStatement(
             actions=["iam:PassRole"],  # NOSONAR: repeated for clarity
             resources=[sagemaker_role.role_arn],  # NOSONAR: repeated for clarity
-        )
+        ),
+        create_baseline_job_policy,
+        sagemaker_tags_policy,
+        s3_write,
+        s3_read,
     )
-    lambda_role.add_to_policy(create_baseline_job_policy)
-    lambda_role.add_to_policy(sagemaker_tags_policy)
-    lambda_role.add_to_policy(s3_write)
-    lambda_role.add_to_policy(s3_read)
-    add_logs_policy(lambda_role)
+    lambda_role_policy = lambda_policy.create_policy(
+        scope, f"{lambda_role.node.id}Policy", lambda_role
+    )
+    logs_policy = add_logs_policy(lambda_role)
 
     # defining the lambda function that gets invoked in this stage
     # create environment variabes
@@ -354,25 +447,25 @@ def create_baseline_job_lambda(
     create_baseline_job_lambda = lambda_.Function(
         scope,
         "create_data_baseline_job",
-        runtime=lambda_.Runtime.PYTHON_3_10,
+        runtime=lambda_runtime,
         handler=lambda_handler,
         role=lambda_role,
         code=lambda_.Code.from_bucket(
-            blueprint_bucket, "blueprints/lambdas/create_baseline_job.zip"
+            blueprint_bucket, blueprint_lambda_key("create_baseline_job")
         ),
         layers=[sm_layer],
         environment=lambda_environment_variables,
+        memory_size=memory_size,
         timeout=Duration.minutes(10),
     )
 
-    create_baseline_job_lambda.node.default_child.cfn_options.metadata = (
-        suppress_lambda_policies()
+    # add suppression
+    lambda_role_policy.node.default_child.cfn_options.metadata = (
+        suppress_pipeline_policy()
     )
+    # the function is invoked during the stack deployment, so it needs its permissions in place
+    create_baseline_job_lambda.node.add_dependency(lambda_role_policy, logs_policy)
 
-    # add suppression
-    create_baseline_job_lambda.role.node.find_child(
-        "DefaultPolicy"
-    ).node.default_child.cfn_options.metadata = suppress_pipeline_policy()
     return create_baseline_job_lambda
 
 
@@ -389,6 +482,7 @@ def create_stackset_action(
     regions,
     stack_name,
     delegated_admin_condition,
+    provisioned_concurrency_condition=None,
 ):
     """
     create_stackset_action an invokeLambda action to be added to AWS Codepipeline stage
@@ -405,9 +499,11 @@ def create_stackset_action(
     :regions: list of regions where the stack with be deployed
     :stack_name: name of the stack to be deployed
     :delegated_admin_condition: CDK condition to indicate if a delegated admin account is used
+    :provisioned_concurrency_condition: optional CDK condition to indicate if the lambda function keeps a provisioned
+    instance (and a reserved concurrent execution). If not provided, no concurrency is provisioned or reserved
     :return: codepipeline invokeLambda action in a form of a CDK object that can be attached to a codepipeline stage
     """
-    # creating a role so that this lambda can create a baseline job
+    # one role per action, so a stage's lambda can only manage that stage's StackSet
     lambda_role = create_service_role(
         scope,
         f"{action_name}_role",
@@ -438,33 +534,34 @@ def create_stackset_action(
         scope, f"{action_name}DelegatedAdminPolicy"
     )
     # create only if a delegated admin account is used
-    Aspects.of(delegated_admin_policy).add(
-        ConditionalResources(delegated_admin_condition)
+    delegated_admin_policy.node.default_child.cfn_options.condition = (
+        delegated_admin_condition
     )
     # attached the policy to the role
     delegated_admin_policy.attach_to_role(lambda_role)
 
+    # setup the CallAS for CF StackSet
+    call_as = Fn.condition_if(
+        delegated_admin_condition.logical_id, "DELEGATED_ADMIN", "SELF"
+    ).to_string()
+
     # defining the lambda function that gets invoked in this stage
     create_update_cf_stackset_lambda = lambda_.Function(
         scope,
         f"{action_name}_stackset_lambda",
-        runtime=lambda_.Runtime.PYTHON_3_10,
+        runtime=lambda_runtime,
         handler="main.lambda_handler",
         role=lambda_role,
         code=lambda_.Code.from_bucket(
-            blueprint_bucket, "blueprints/lambdas/create_update_cf_stackset.zip"
+            blueprint_bucket, blueprint_lambda_key("create_update_cf_stackset")
         ),
         timeout=Duration.minutes(15),
-        # setup the CallAS for CF StackSet
-        environment={
-            "CALL_AS": Fn.condition_if(
-                delegated_admin_condition.logical_id, "DELEGATED_ADMIN", "SELF"
-            ).to_string()
-        },
-    )
-
-    create_update_cf_stackset_lambda.node.default_child.cfn_options.metadata = (
-        suppress_lambda_policies()
+        environment={"CALL_AS": call_as},
+        # the version's logical id does not change with the parameters' values, so the description does. A new
+        # version is then published (and the alias moved to it) when a stack update changes CALL_AS
+        current_version_options=lambda_.VersionOptions(
+            description=f"CALL_AS: {call_as}"
+        ),
     )
 
     # add suppression
@@ -472,12 +569,30 @@ def create_stackset_action(
         "DefaultPolicy"
     ).node.default_child.cfn_options.metadata = suppress_pipeline_policy()
 
+    # publish a version, and invoke it through its alias
+    create_update_cf_stackset_alias = create_update_cf_stackset_lambda.add_alias(
+        lambda_alias_name
+    )
+
+    if provisioned_concurrency_condition:
+        # keep a provisioned instance, so the stage does not wait for a cold start, and run one invocation
+        # at a time per stage. Opt-in, since the account must keep at least 100 unreserved concurrent executions
+        condition_id = provisioned_concurrency_condition.logical_id
+        cfn_function = create_update_cf_stackset_lambda.node.default_child
+        cfn_function.reserved_concurrent_executions = Token.as_number(
+            Fn.condition_if(condition_id, 1, Aws.NO_VALUE)
+        )
+        cfn_alias = create_update_cf_stackset_alias.node.default_child
+        cfn_alias.provisioned_concurrency_config = Fn.condition_if(
+            condition_id, {"ProvisionedConcurrentExecutions": 1}, Aws.NO_VALUE
+        )
+
     # Create codepipeline action
     create_stackset_action = codepipeline_actions.LambdaInvokeAction(
         action_name=action_name,
         inputs=[source_output],
         variables_namespace=f"{action_name}-namespace",
-        lambda_=create_update_cf_stackset_lambda,
+        lambda_=create_update_cf_stackset_alias,
         user_parameters={
             "stackset_name": stack_name,
             "artifact": artifact,
@@ -489,7 +604,7 @@ def create_stackset_action(
         },
         run_order=1,
     )
-    return (create_update_cf_stackset_lambda.function_arn, create_stackset_action)
+    return (create_update_cf_stackset_alias.function_arn, create_stackset_action)
 
 
 def create_cloudformation_action(
@@ -530,6 +645,24 @@ def create_cloudformation_action(
     return create_cloudformation_action
 
 
+class InvokeLambdaCustomResourceProvider(Construct):
+    """
+    Keeps the invoker lambda function shared by the custom resources of a scope, and its invoke permissions.
+    It does not synthesize any resources.
+
+    Attributes:
+        scope (CDK Construct scope): that's needed to create CDK resources
+        id (str): CDK construct's id
+        function (CDK Lambda Function): the invoker lambda function
+        invoke_policy (CDK IAM PolicyStatement): statement allowing the function to invoke the target functions
+    """
+
+    def __init__(self, scope, id, function, invoke_policy):
+        super().__init__(scope, id)
+        self.function = function
+        self.invoke_policy = invoke_policy
+
+
 def create_invoke_lambda_custom_resource(
     scope,  # NOSONAR:S107 this function is designed to take many arguments
     id,
@@ -539,7 +672,8 @@ def create_invoke_lambda_custom_resource(
     custom_resource_properties,
 ):
     """
-    create_invoke_lambda_custom_resource creates a custom resource to invoke lambda function
+    create_invoke_lambda_custom_resource creates a custom resource to invoke lambda function. The invoker lambda
+    function is created by the scope's first call, and reused by the next ones.
 
     :scope: CDK Construct scope that's needed to create CDK resources
     :id: the logicalId of teh CDK resource
@@ -550,34 +684,43 @@ def create_invoke_lambda_custom_resource(
 
     :return: CDK Custom Resource
     """
-    custom_resource_lambda_fn = lambda_.Function(
-        scope,
-        id,
-        code=lambda_.Code.from_bucket(
-            blueprint_bucket,
-            "blueprints/lambdas/invoke_lambda_custom_resource.zip",
-        ),
-        handler="index.handler",
-        runtime=lambda_.Runtime.PYTHON_3_10,
-        timeout=Duration.minutes(5),
-    )
+    # the custom resources of a scope share one invoker lambda, allowed to invoke all their target functions
+    invoker = scope.node.try_find_child("InvokeLambdaCustomResourceProvider")
+    if invoker:
+        invoker.invoke_policy.add_resources(lambda_function_arn)
+    else:
+        # the function keeps the first caller's id, so its logical id (i.e., the custom resources' ServiceToken)
+        # does not change for the stacks deployed before it was shared
+        custom_resource_lambda_fn = lambda_.Function(
+            scope,
+            id,
+            code=lambda_.Code.from_bucket(
+                blueprint_bucket,
+                blueprint_lambda_key("invoke_lambda_custom_resource"),
+            ),
+            handler="index.handler",
+            runtime=lambda_runtime,
+            timeout=Duration.minutes(5),
+        )
 
-    custom_resource_lambda_fn.add_to_role_policy(
-        iam.PolicyStatement(
+        invoke_policy = iam.PolicyStatement(
             actions=[
                 "lambda:InvokeFunction",
             ],
             resources=[lambda_function_arn],
         )
-    )
-    custom_resource_lambda_fn.node.default_child.cfn_options.metadata = (
-        suppress_lambda_policies()
-    )
+        custom_resource_lambda_fn.add_to_role_policy(invoke_policy)
+        invoker = InvokeLambdaCustomResourceProvider(
+            scope,
+            "InvokeLambdaCustomResourceProvider",
+            custom_resource_lambda_fn,
+            invoke_policy,
+        )
 
     invoke_lambda_custom_resource = CustomResource(
         scope,
         f"{id}CustomResource",
-        service_token=custom_resource_lambda_fn.function_arn,
+        service_token=invoker.function.function_arn,
         properties={
             "function_name": lambda_function_name,
             "message": f"Invoking lambda function: {lambda_function_name}",
@@ -610,7 +753,7 @@ def create_copy_assets_lambda(scope, blueprint_repository_bucket_name):
         "CustomResourceLambda",
         code=lambda_.Code.from_asset("../lambdas/custom_resource"),
         handler="index.on_event",
-        runtime=lambda_.Runtime.PYTHON_3_10,
+        runtime=lambda_runtime,
         memory_size=256,
         environment={
             "SOURCE_BUCKET": source_bucket,
@@ -621,9 +764,6 @@ def create_copy_assets_lambda(scope, blueprint_repository_bucket_name):
         timeout=Duration.minutes(10),
     )
 
-    custom_resource_lambda_fn.node.default_child.cfn_options.metadata = (
-        suppress_lambda_policies()
-    )
     # grant permission to download the file from the source bucket
     custom_resource_lambda_fn.add_to_role_policy(
         s3_policy_read(
@@ -650,12 +790,10 @@ def create_solution_helper(scope):
         "SolutionHelper",
         code=lambda_.Code.from_asset("../lambdas/solution_helper"),
         handler="lambda_function.handler",
-        runtime=lambda_.Runtime.PYTHON_3_10,
+        runtime=lambda_runtime,
         timeout=Duration.minutes(5),
     )
 
-    helper_function.node.default_child.cfn_options.metadata = suppress_lambda_policies()
-
     return helper_function
 
 
@@ -746,8 +884,7 @@ def autopilot_training_job(
     """
     s3_read = s3_policy_read(
         [
-            f"arn:{Aws.PARTITION}:s3:::{assets_bucket.bucket_name}",
-            f"arn:{Aws.PARTITION}:s3:::{assets_bucket.bucket_name}/*",
+            *_bucket_arns(assets_bucket),
         ]
     )
 
@@ -763,8 +900,8 @@ def autopilot_training_job(
 
     # Kms Key permissions
     kms_policy = kms_policy_document(scope, "AutopilotKmsPolicy", kms_key_arn)
-    # add conditions to KMS and ECR policies
-    Aspects.of(kms_policy).add(ConditionalResources(kms_key_arn_provided_condition))
+    # create the KMS policy only if a kms key arn is provided
+    kms_policy.node.default_child.cfn_options.condition = kms_key_arn_provided_condition
 
     sagemaker_logs_policy = sagemaker_logs_metrics_policy_document(
         scope, "AutopilotLogsMetrics"
@@ -785,13 +922,6 @@ def autopilot_training_job(
     sagemaker_role.add_to_policy(s3_read)
     sagemaker_role.add_to_policy(s3_write)
 
-    # create a trust relation to assume the Role
-    sagemaker_role.add_to_policy(
-        iam.PolicyStatement(
-            actions=["sts:AssumeRole"], resources=[sagemaker_role.role_arn]
-        )
-    )
-
     lambda_role = create_service_role(
         scope,
         "autopilot_job_lambda_role",
@@ -805,18 +935,18 @@ def autopilot_training_job(
             actions=["iam:PassRole"], resources=[sagemaker_role.role_arn]
         )
     )
-    add_logs_policy(lambda_role)
+    logs_policy = add_logs_policy(lambda_role)
 
     autopilot_lambda = lambda_.Function(
         scope,
         id,
-        runtime=lambda_.Runtime.PYTHON_3_10,
+        runtime=lambda_runtime,
         handler=lambda_handler,
         layers=[sm_layer],
         role=lambda_role,
         code=lambda_.Code.from_bucket(
             blueprint_bucket,
-            "blueprints/lambdas/create_sagemaker_autopilot_job.zip",
+            blueprint_lambda_key("create_sagemaker_autopilot_job"),
         ),
         environment={
             "JOB_NAME": job_name,
@@ -838,10 +968,8 @@ def autopilot_training_job(
         },
         timeout=Duration.minutes(10),
     )
-
-    autopilot_lambda.node.default_child.cfn_options.metadata = (
-        suppress_lambda_policies()
-    )
+    # the function is invoked during the stack deployment, so it needs its logs permissions in place
+    autopilot_lambda.node.add_dependency(logs_policy)
 
     return autopilot_lambda
 
@@ -884,8 +1012,7 @@ def model_training_job(
     """
     s3_read = s3_policy_read(
         [
-            f"arn:{Aws.PARTITION}:s3:::{assets_bucket.bucket_name}",
-            f"arn:{Aws.PARTITION}:s3:::{assets_bucket.bucket_name}/*",
+            *_bucket_arns(assets_bucket),
         ]
     )
 
@@ -900,8 +1027,8 @@ def model_training_job(
 
     # Kms Key permissions
     kms_policy = kms_policy_document(scope, "TrainingKmsPolicy", kms_key_arn)
-    # add conditions to KMS and ECR policies
-    Aspects.of(kms_policy).add(ConditionalResources(kms_key_arn_provided_condition))
+    # create the KMS policy only if a kms key arn is provided
+    kms_policy.node.default_child.cfn_options.condition = kms_key_arn_provided_condition
 
     sagemaker_logs_policy = sagemaker_logs_metrics_policy_document(
         scope, "TrainingLogsMetrics"
@@ -921,13 +1048,6 @@ def model_training_job(
     sagemaker_role.add_to_policy(s3_read)
     sagemaker_role.add_to_policy(s3_write)
 
-    # create a trust relation to assume the Role
-    sagemaker_role.add_to_policy(
-        iam.PolicyStatement(
-            actions=["sts:AssumeRole"], resources=[sagemaker_role.role_arn]
-        )
-    )
-
     lambda_role = create_service_role(
         scope,
         "training_job_lambda_role",
@@ -941,17 +1061,17 @@ def model_training_job(
             actions=["iam:PassRole"], resources=[sagemaker_role.role_arn]
         )
     )
-    add_logs_policy(lambda_role)
+    logs_policy = add_logs_policy(lambda_role)
 
     training_lambda = lambda_.Function(
         scope,
         id,
-        runtime=lambda_.Runtime.PYTHON_3_10,
+        runtime=lambda_runtime,
         handler=lambda_handler,
         layers=[sm_layer],
         role=lambda_role,
         code=lambda_.Code.from_bucket(
-            blueprint_bucket, "blueprints/lambdas/create_model_training_job.zip"
+            blueprint_bucket, blueprint_lambda_key("create_model_training_job")
         ),
         environment={
             "JOB_NAME": job_name,
@@ -986,8 +1106,8 @@ def model_training_job(
         },
         timeout=Duration.minutes(10),
     )
-
-    training_lambda.node.default_child.cfn_options.metadata = suppress_lambda_policies()
+    # the function is invoked during the stack deployment, so it needs its logs permissions in place
+    training_lambda.node.add_dependency(logs_policy)
 
     return training_lambda
 
@@ -10,7 +10,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
-from aws_cdk import Aws, aws_iam as iam
+from aws_cdk import Aws, Stack, aws_iam as iam
 
 logs_str = ":logs:"
 
@@ -53,44 +53,63 @@ def pipeline_permissions(pipeline, assets_bucket):
 
 
 def add_logs_policy(function_role):
-    function_role.add_to_policy(
-        iam.PolicyStatement(
-            actions=[
-                "logs:CreateLogStream",
-                "logs:PutLogEvents",
-            ],
-            resources=[
-                "arn:"
-                + Aws.PARTITION
-                + logs_str
-                + Aws.REGION
-                + ":"
-                + Aws.ACCOUNT_ID
-                + ":log-group:/aws/lambda/*",
-                "arn:"
-                + Aws.PARTITION
-                + logs_str
-                + Aws.REGION
-                + ":"
-                + Aws.ACCOUNT_ID
-                + ":log-group:*:log-stream:*",
-            ],
-        )
-    )
-    function_role.add_to_policy(
-        iam.PolicyStatement(
-            actions=["logs:CreateLogGroup"],
-            resources=[
-                "arn:"
-                + Aws.PARTITION
-                + logs_str
-                + Aws.REGION
-                + ":"
-                + Aws.ACCOUNT_ID
-                + ":*"
-            ],
-        )
+    """
+    add_logs_policy attaches the lambda logs permissions to a function's role. One policy is created per stack,
+    and attached to all the functions' roles in that stack.
+
+    :function_role: CDK IAM Role object of the lambda function
+    :return: CDK IAM Policy object of the logs permissions
+    """
+    stack = Stack.of(function_role)
+    logs_policy = stack.node.try_find_child("LambdaLogsPolicy")
+    if logs_policy:
+        logs_policy.attach_to_role(function_role)
+        return logs_policy
+
+    logs_policy = iam.Policy(
+        stack,
+        "LambdaLogsPolicy",
+        statements=[
+            iam.PolicyStatement(
+                actions=[
+                    "logs:CreateLogStream",
+                    "logs:PutLogEvents",
+                ],
+                resources=[
+                    "arn:"
+                    + Aws.PARTITION
+                    + logs_str
+                    + Aws.REGION
+                    + ":"
+                    + Aws.ACCOUNT_ID
+                    + ":log-group:/aws/lambda/*",
+                    "arn:"
+                    + Aws.PARTITION
+                    + logs_str
+                    + Aws.REGION
+                    + ":"
+                    + Aws.ACCOUNT_ID
+                    + ":log-group:*:log-stream:*",
+                ],
+            ),
+            iam.PolicyStatement(
+                actions=["logs:CreateLogGroup"],
+                resources=[
+                    "arn:"
+                    + Aws.PARTITION
+                    + logs_str
+                    + Aws.REGION
+                    + ":"
+                    + Aws.ACCOUNT_ID
+                    + ":*"
+                ],
+            ),
+        ],
+        roles=[function_role],
     )
+    logs_policy.node.default_child.cfn_options.metadata = suppress_lambda_logs_policy()
+
+    return logs_policy
 
 
 def suppress_pipeline_policy():
@@ -257,6 +276,22 @@ def suppress_lambda_policies():
     }
 
 
+def suppress_lambda_logs_policy():
+    return {
+        "cfn_nag": {
+            "rules_to_suppress": [
+                {
+                    "id": "W12",
+                    "reason": (
+                        "The lambda functions' log groups are created on their first invocation, "
+                        "so logs:CreateLogGroup can not be bound to their names."
+                    ),
+                }
+            ]
+        }
+    }
+
+
 def suppress_delegated_admin_policy():
     return {
         "cfn_nag": {
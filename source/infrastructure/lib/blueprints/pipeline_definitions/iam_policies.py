@@ -10,7 +10,8 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
-from aws_cdk import aws_iam as iam, Fn, Aws
+import json
+from aws_cdk import aws_iam as iam, Fn, Aws, Token
 from lib.blueprints.pipeline_definitions.helpers import (
     suppress_ecr_policy,
     suppress_cloudwatch_policy,
@@ -175,6 +176,94 @@ def autopilot_job_endpoint_policy(job_name):
     )
 
 
+class PolicyBuilder:
+    """
+    PolicyBuilder accumulates IAM policy statements for a role and merges the statements that only
+    differ in their resources, so the rendered policy document has one statement per
+    (effect, actions, conditions) group. Statements with a Sid, principals, or Not* elements are kept as-is.
+    """
+
+    def __init__(self, *statements):
+        self._groups = {}
+        self._unmerged = []
+        self.add(*statements)
+
+    def add(self, *statements):
+        """
+        add adds policy statements to the builder
+
+        :statements: CDK PolicyStatement objects
+        :return: the builder, to allow chaining
+        """
+        for statement in statements:
+            if (
+                statement.sid
+                or statement.principals
+                or statement.not_principals
+                or statement.not_actions
+                or statement.not_resources
+            ):
+                self._unmerged.append(statement)
+                continue
+            # unresolved tokens (e.g., Fn.condition_if) in the conditions are keyed by their token string
+            key = (
+                statement.effect,
+                frozenset(statement.actions),
+                json.dumps(
+                    statement.conditions, sort_keys=True, default=Token.as_string
+                ),
+            )
+            group = self._groups.setdefault(
+                key,
+                {
+                    "actions": dict.fromkeys(statement.actions),
+                    "resources": {},
+                    "conditions": statement.conditions,
+                },
+            )
+            # dict is used as an ordered set, so identical resources are added once
+            group["resources"].update(dict.fromkeys(statement.resources))
+        return self
+
+    def statements(self):
+        """
+        statements returns the merged policy statements
+
+        :return: list of CDK PolicyStatement objects
+        """
+        merged = [
+            iam.PolicyStatement(
+                effect=effect,
+                actions=list(group["actions"]),
+                resources=list(group["resources"]),
+                conditions=group["conditions"] or None,
+            )
+            for (effect, _, _), group in self._groups.items()
+        ]
+        return merged + self._unmerged
+
+    def attach_to_role(self, role):
+        """
+        attach_to_role adds the merged policy statements to the role's default policy
+
+        :role: CDK IAM Role object
+        :return: nothing
+        """
+        for statement in self.statements():
+            role.add_to_policy(statement)
+
+    def create_policy(self, scope, id, role):
+        """
+        create_policy creates a single IAM policy with the merged policy statements, and attaches it to the role
+
+        :scope: CDK Construct scope that's needed to create CDK resources
+        :id: the logicalId of the policy
+        :role: CDK IAM Role object
+        :return: CDK IAM Policy object
+        """
+        return iam.Policy(scope, id, statements=self.statements(), roles=[role])
+
+
 def create_service_role(scope, id, service, description):
     return iam.Role(
         scope,
@@ -617,6 +706,17 @@ def create_orchestrator_policy(
                     "lambda:RemovePermission",
                     "lambda:UpdateFunctionConfiguration",
                     "lambda:TagResource",
+                    "lambda:PublishVersion",
+                    "lambda:ListVersionsByFunction",
+                    "lambda:CreateAlias",
+                    "lambda:UpdateAlias",
+                    "lambda:DeleteAlias",
+                    "lambda:GetAlias",
+                    "lambda:PutProvisionedConcurrencyConfig",
+                    "lambda:GetProvisionedConcurrencyConfig",
+                    "lambda:DeleteProvisionedConcurrencyConfig",
+                    "lambda:PutFunctionConcurrency",
+                    "lambda:DeleteFunctionConcurrency",
                 ],
                 resources=[
                     f"arn:{Aws.PARTITION}:lambda:{Aws.REGION}:{Aws.ACCOUNT_ID}:layer:*",
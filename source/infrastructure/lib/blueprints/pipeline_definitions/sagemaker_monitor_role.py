@@ -67,7 +67,9 @@ def create_sagemaker_monitor_role(
     )
     # S3 permissions
     s3_read_resources = list(
-        set(  # set is used since a same bucket can be used more than once
+        # dict is used as an ordered set, since a same bucket can be used more than once
+        # (a set's order changes between synth runs)
+        dict.fromkeys(
             [
                 f"arn:{Aws.PARTITION}:s3:::{assets_bucket_name}",
                 f"arn:{Aws.PARTITION}:s3:::{assets_bucket_name}/*",
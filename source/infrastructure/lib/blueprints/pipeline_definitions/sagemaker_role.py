@@ -76,7 +76,8 @@ def create_sagemaker_role(
     # S3 permissions
     s3_read = s3_policy_read(
         list(
-            set(
+            # dict is used as an ordered set (a set's order changes between synth runs)
+            dict.fromkeys(
                 [
                     f"arn:{Aws.PARTITION}:s3:::{assets_bucket_name}",
                     f"arn:{Aws.PARTITION}:s3:::{assets_bucket_name}/*",
@@ -515,6 +515,35 @@ class ParameteresFactory:
             description="Is a delegated administrator account used to deploy across account",
         )
 
+    @staticmethod
+    def create_provisioned_concurrency_parameter(scope: Construct) -> CfnParameter:
+        return CfnParameter(
+            scope,
+            "ProvisionedConcurrency",
+            type="String",
+            allowed_values=["Yes", "No"],
+            default="No",
+            description=(
+                "Keep one provisioned (warm) instance of each StackSet lambda function, and reserve one concurrent "
+                "execution for it. The account must have enough unreserved concurrency left"
+            ),
+        )
+
+    @staticmethod
+    def create_lambda_memory_size_parameter(scope: Construct) -> CfnParameter:
+        return CfnParameter(
+            scope,
+            "LambdaMemorySize",
+            type="Number",
+            default="1769",
+            description=(
+                "Memory (MB) of the pipeline's lambda function, which also sets its CPU share. "
+                "The default, 1769 MB, gives it one vCPU"
+            ),
+            min_value=128,
+            max_value=10240,
+        )
+
     @staticmethod
     def create_detailed_error_message_parameter(
         scope: Construct,
@@ -1114,6 +1143,18 @@ class ConditionsFactory:
             ),
         )
 
+    @staticmethod
+    def create_provisioned_concurrency_condition(
+        scope: Construct, provisioned_concurrency_parameter: CfnParameter
+    ) -> CfnCondition:
+        return CfnCondition(
+            scope,
+            "UseProvisionedConcurrency",
+            expression=Fn.condition_equals(
+                provisioned_concurrency_parameter.value_as_string, "Yes"
+            ),
+        )
+
     @staticmethod
     def create_model_registry_condition(
         scope: Construct, create_model_registry: CfnParameter
@@ -10,7 +10,6 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
-import uuid
 from constructs import Construct
 from aws_cdk import (
     Stack,
@@ -41,7 +40,6 @@ from aws_solutions_constructs import aws_apigateway_lambda
 from lib.blueprints.aspects.conditional_resource import ConditionalResources
 from lib.blueprints.pipeline_definitions.helpers import (
     suppress_s3_access_policy,
-    suppress_lambda_policies,
     suppress_sns,
 )
 from lib.blueprints.pipeline_definitions.templates_parameters import (
@@ -50,10 +48,12 @@ from lib.blueprints.pipeline_definitions.templates_parameters import (
 )
 from lib.blueprints.pipeline_definitions.deploy_actions import (
     sagemaker_layer,
+    blueprint_lambda_keys,
     create_solution_helper,
     create_uuid_custom_resource,
     create_send_data_custom_resource,
     create_copy_assets_lambda,
+    lambda_runtime,
 )
 from lib.blueprints.pipeline_definitions.iam_policies import (
     create_invoke_lambda_policy,
@@ -169,7 +169,7 @@ class MLOpsStack(Stack):
         # Creating assets bucket so that users can upload ML Models to it.
         assets_bucket = s3.Bucket(
             self,
-            "pipeline-assets-" + str(uuid.uuid4()),
+            "pipeline-assets",
             versioned=True,
             encryption=s3.BucketEncryption.S3_MANAGED,
             server_access_logs_bucket=access_logs_bucket,
@@ -188,7 +188,7 @@ class MLOpsStack(Stack):
             assets_bucket.bucket_name,
         ).to_string()
 
-        blueprints_bucket_name = "blueprint-repository-" + str(uuid.uuid4())
+        blueprints_bucket_name = "blueprint-repository"
         blueprint_repository_bucket = s3.Bucket(
             self,
             blueprints_bucket_name,
@@ -298,12 +298,14 @@ class MLOpsStack(Stack):
             self, blueprint_repository_bucket.bucket_name
         )
 
-        # grant permission to upload file to the blueprints bucket
-        blueprint_repository_bucket.grant_write(custom_resource_lambda_fn)
+        # grant permission to upload file to the blueprints bucket (and compare it with the uploaded one)
+        blueprint_repository_bucket.grant_read_write(custom_resource_lambda_fn)
         custom_resource = CustomResource(
             self,
             "CustomResourceCopyAssets",
             service_token=custom_resource_lambda_fn.function_arn,
+            # copy the assets again when a blueprint lambda's key changes (i.e., on solution's update)
+            properties={"blueprint_lambda_keys": blueprint_lambda_keys()},
         )
         custom_resource.node.add_dependency(blueprint_repository_bucket)
         # IAM policies setup ###
@@ -337,7 +339,7 @@ class MLOpsStack(Stack):
             self,
             "PipelineOrchestration",
             lambda_function_props={
-                "runtime": lambda_.Runtime.PYTHON_3_10,
+                "runtime": lambda_runtime,
                 "handler": "index.handler",
                 "code": lambda_.Code.from_asset("../lambdas/pipeline_orchestration"),
                 "layers": [sm_layer],
@@ -353,14 +355,6 @@ class MLOpsStack(Stack):
             },
         )
 
-        # add lambda suppressions
-        provisioner_apigw_lambda.lambda_function.node.default_child.cfn_options.metadata = (
-            suppress_lambda_policies()
-        )
-        provisioner_apigw_lambda.lambda_function.node.default_child.cfn_options.metadata = (
-            suppress_lambda_policies()
-        )
-
         provision_resource = provisioner_apigw_lambda.api_gateway.root.add_resource(
             "provisionpipeline"
         )
@@ -516,8 +510,9 @@ class MLOpsStack(Stack):
             )
         )
 
-        pipeline_child_nodes = codecommit_pipeline.node.find_all()
-        pipeline_child_nodes[1].node.default_child.cfn_options.metadata = {
+        codecommit_pipeline.node.find_child(
+            "ArtifactsBucket"
+        ).node.default_child.cfn_options.metadata = {
             "cfn_nag": {
                 "rules_to_suppress": [
                     {
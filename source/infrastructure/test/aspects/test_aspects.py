@@ -11,11 +11,17 @@
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
 import aws_cdk as cdk
+from aws_cdk import aws_lambda as lambda_, aws_s3 as s3
 from aws_cdk.assertions import Template, Match
 from lib.mlops_orchestrator_stack import MLOpsStack
 from lib.blueprints.aspects.aws_sdk_config_aspect import AwsSDKConfigAspect
 from lib.blueprints.aspects.protobuf_config_aspect import ProtobufConfigAspect
 from lib.blueprints.aspects.app_registry_aspect import AppRegistry
+from lib.blueprints.aspects.lambda_policies_suppression_aspect import (
+    LambdaPoliciesSuppression,
+)
+from lib.blueprints.pipeline_definitions.helpers import suppress_lambda_policies
+from lib.blueprints.pipeline_definitions.deploy_actions import lambda_runtime
 from lib.blueprints.pipeline_definitions.cdk_context_value import (
     get_cdk_context_value,
 )
@@ -168,3 +174,40 @@ class TestAspects:
                 }
             },
         )
+
+    def test_lambda_policies_suppression_aspect(self):
+        stack = cdk.Stack(cdk.App(), "LambdaPoliciesSuppressionStack")
+        cdk.Aspects.of(stack).add(LambdaPoliciesSuppression())
+        blueprint_bucket = s3.Bucket.from_bucket_name(
+            stack, "BlueprintBucket", "blueprint-bucket"
+        )
+        for id in ["FirstFunction", "SecondFunction"]:
+            lambda_.Function(
+                stack,
+                id,
+                code=lambda_.Code.from_bucket(blueprint_bucket, "lambda.zip"),
+                handler="index.handler",
+                runtime=lambda_runtime,
+            )
+        # functions with their own metadata are left as they are
+        stack.node.find_child(
+            "SecondFunction"
+        ).node.default_child.cfn_options.metadata = {
+            "cfn_nag": {"rules_to_suppress": [{"id": "W89", "reason": "no vpc"}]}
+        }
+        template = Template.from_stack(stack)
+
+        template.has_resource(
+            "AWS::Lambda::Function",
+            {"Metadata": {"cfn_nag": suppress_lambda_policies()["cfn_nag"]}},
+        )
+        template.has_resource(
+            "AWS::Lambda::Function",
+            {
+                "Metadata": {
+                    "cfn_nag": {
+                        "rules_to_suppress": [{"id": "W89", "reason": "no vpc"}]
+                    }
+                }
+            },
+        )
@@ -12,6 +12,9 @@
 # #####################################################################################################################
 import aws_cdk as cdk
 from aws_cdk.assertions import Template, Match
+from lib.blueprints.aspects.lambda_policies_suppression_aspect import (
+    LambdaPoliciesSuppression,
+)
 from lib.blueprints.ml_pipelines.autopilot_training_pipeline import (
     AutopilotJobStack,
 )
@@ -42,6 +45,9 @@ class TestAutoPilotTraining:
             ),
         )
 
+        # add the cfn_nag lambda suppressions to the stack's Lambda functions
+        cdk.Aspects.of(autopilot_stack).add(LambdaPoliciesSuppression())
+
         # create template
         self.template = Template.from_stack(autopilot_stack)
 
@@ -246,9 +252,11 @@ class TestAutoPilotTraining:
             {
                 "Content": {
                     "S3Bucket": {"Ref": "BlueprintBucket"},
-                    "S3Key": "blueprints/lambdas/sagemaker_layer.zip",
+                    "S3Key": Match.string_like_regexp(
+                        "blueprints/lambdas/sagemaker_layer\\.[0-9a-f]{12}\\.zip"
+                    ),
                 },
-                "CompatibleRuntimes": ["python3.9", "python3.10"],
+                "CompatibleRuntimes": ["python3.12"],
             },
         )
 
@@ -296,7 +304,9 @@ class TestAutoPilotTraining:
             {
                 "Code": {
                     "S3Bucket": {"Ref": "BlueprintBucket"},
-                    "S3Key": "blueprints/lambdas/create_sagemaker_autopilot_job.zip",
+                    "S3Key": Match.string_like_regexp(
+                        "blueprints/lambdas/create_sagemaker_autopilot_job\\.[0-9a-f]{12}\\.zip"
+                    ),
                 },
                 "Role": {
                     "Fn::GetAtt": [
@@ -361,7 +371,7 @@ class TestAutoPilotTraining:
                 },
                 "Handler": "main.handler",
                 "Layers": [{"Ref": Match.string_like_regexp("sagemakerlayer*")}],
-                "Runtime": "python3.10",
+                "Runtime": "python3.12",
                 "Timeout": 600,
             },
         )
@@ -372,6 +382,7 @@ class TestAutoPilotTraining:
                 "DependsOn": [
                     Match.string_like_regexp("autopilotjoblambdaroleDefaultPolicy*"),
                     Match.string_like_regexp("autopilotjoblambdarole*"),
+                    Match.string_like_regexp("LambdaLogsPolicy*"),
                 ],
                 "Metadata": {
                     "cfn_nag": {
@@ -401,7 +412,9 @@ class TestAutoPilotTraining:
             {
                 "Code": {
                     "S3Bucket": {"Ref": "BlueprintBucket"},
-                    "S3Key": "blueprints/lambdas/invoke_lambda_custom_resource.zip",
+                    "S3Key": Match.string_like_regexp(
+                        "blueprints/lambdas/invoke_lambda_custom_resource\\.[0-9a-f]{12}\\.zip"
+                    ),
                 },
                 "Role": {
                     "Fn::GetAtt": [
@@ -410,7 +423,7 @@ class TestAutoPilotTraining:
                     ]
                 },
                 "Handler": "index.handler",
-                "Runtime": "python3.10",
+                "Runtime": "python3.12",
                 "Timeout": 300,
             },
         )
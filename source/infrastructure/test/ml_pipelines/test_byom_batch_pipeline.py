@@ -167,6 +167,16 @@ class TestBatchInference:
             },
         )
 
+        self.template.has_parameter(
+            "LambdaMemorySize",
+            {
+                "Type": "Number",
+                "Default": "1769",
+                "MinValue": 128,
+                "MaxValue": 10240,
+            },
+        )
+
     def test_template_conditions(self):
         """Tests for templates conditions"""
         self.template.has_condition(
@@ -191,9 +201,11 @@ class TestBatchInference:
             {
                 "Content": {
                     "S3Bucket": {"Ref": "BlueprintBucket"},
-                    "S3Key": "blueprints/lambdas/sagemaker_layer.zip",
+                    "S3Key": Match.string_like_regexp(
+                        "blueprints/lambdas/sagemaker_layer\\.[0-9a-f]{12}\\.zip"
+                    ),
                 },
-                "CompatibleRuntimes": ["python3.9", "python3.10"],
+                "CompatibleRuntimes": ["python3.12"],
             },
         )
 
@@ -427,7 +439,9 @@ class TestBatchInference:
             {
                 "Code": {
                     "S3Bucket": {"Ref": "BlueprintBucket"},
-                    "S3Key": "blueprints/lambdas/batch_transform.zip",
+                    "S3Key": Match.string_like_regexp(
+                        "blueprints/lambdas/batch_transform\\.[0-9a-f]{12}\\.zip"
+                    ),
                 },
                 "Role": {
                     "Fn::GetAtt": [
@@ -456,7 +470,94 @@ class TestBatchInference:
                 },
                 "Handler": "main.handler",
                 "Layers": [{"Ref": Match.string_like_regexp("sagemakerlayer*")}],
-                "Runtime": "python3.10",
+                "MemorySize": {"Ref": "LambdaMemorySize"},
+                "Runtime": "python3.12",
+                "Timeout": 300,
+            },
+        )
+
+    def test_batch_lambda_policy(self):
+        """Tests for Batch Lambda function's policy"""
+        self.template.has_resource_properties(
+            "AWS::IAM::Policy",
+            {
+                "PolicyDocument": {
+                    "Statement": Match.array_with(
+                        [
+                            {
+                                "Action": ["s3:GetObject", "s3:ListBucket"],
+                                "Effect": "Allow",
+                                "Resource": [
+                                    {
+                                        "Fn::Join": [
+                                            "",
+                                            [
+                                                "arn:",
+                                                {"Ref": "AWS::Partition"},
+                                                ":s3:::",
+                                                {"Ref": "AssetsBucket"},
+                                            ],
+                                        ]
+                                    },
+                                    {
+                                        "Fn::Join": [
+                                            "",
+                                            [
+                                                "arn:",
+                                                {"Ref": "AWS::Partition"},
+                                                ":s3:::",
+                                                {"Ref": "AssetsBucket"},
+                                                "/*",
+                                            ],
+                                        ]
+                                    },
+                                    {
+                                        "Fn::Join": [
+                                            "",
+                                            [
+                                                "arn:",
+                                                {"Ref": "AWS::Partition"},
+                                                ":s3:::",
+                                                {"Ref": "BatchInputBucket"},
+                                            ],
+                                        ]
+                                    },
+                                    {
+                                        "Fn::Join": [
+                                            "",
+                                            [
+                                                "arn:",
+                                                {"Ref": "AWS::Partition"},
+                                                ":s3:::",
+                                                {"Ref": "BatchInferenceData"},
+                                            ],
+                                        ]
+                                    },
+                                ],
+                            },
+                            {
+                                "Action": "s3:PutObject",
+                                "Effect": "Allow",
+                                "Resource": {
+                                    "Fn::Join": [
+                                        "",
+                                        [
+                                            "arn:",
+                                            {"Ref": "AWS::Partition"},
+                                            ":s3:::",
+                                            {"Ref": "BatchOutputLocation"},
+                                            "/*",
+                                        ],
+                                    ]
+                                },
+                            },
+                        ]
+                    ),
+                    "Version": "2012-10-17",
+                },
+                "Roles": [
+                    {"Ref": Match.string_like_regexp("batchtransformlambdarole*")}
+                ],
             },
         )
 
@@ -467,7 +568,9 @@ class TestBatchInference:
             {
                 "Code": {
                     "S3Bucket": {"Ref": "BlueprintBucket"},
-                    "S3Key": "blueprints/lambdas/invoke_lambda_custom_resource.zip",
+                    "S3Key": Match.string_like_regexp(
+                        "blueprints/lambdas/invoke_lambda_custom_resource\\.[0-9a-f]{12}\\.zip"
+                    ),
                 },
                 "Role": {
                     "Fn::GetAtt": [
@@ -476,7 +579,7 @@ class TestBatchInference:
                     ]
                 },
                 "Handler": "index.handler",
-                "Runtime": "python3.10",
+                "Runtime": "python3.12",
                 "Timeout": 300,
             },
         )
@@ -529,6 +632,11 @@ class TestBatchInference:
             },
         )
 
+        # the function is invoked at $LATEST, so a stack update that only changes parameters (e.g., the model
+        # name, or LambdaMemorySize) is picked up by the next invocation, with no stale published version
+        self.template.resource_count_is("AWS::Lambda::Version", 0)
+        self.template.resource_count_is("AWS::Lambda::Alias", 0)
+
     def test_template_outputs(self):
         """Tests for templates outputs"""
         self.template.has_output(
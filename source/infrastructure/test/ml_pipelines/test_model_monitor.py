@@ -276,6 +276,16 @@ class TestModelMonitor:
                 },
             )
 
+            template.has_parameter(
+                "LambdaMemorySize",
+                {
+                    "Type": "Number",
+                    "Default": "1769",
+                    "MinValue": 128,
+                    "MaxValue": 10240,
+                },
+            )
+
     def test_template_conditions(self):
         """Tests for templates conditions"""
         for template in self.templates:
@@ -292,9 +302,11 @@ class TestModelMonitor:
                 {
                     "Content": {
                         "S3Bucket": {"Ref": "BlueprintBucket"},
-                        "S3Key": "blueprints/lambdas/sagemaker_layer.zip",
+                        "S3Key": Match.string_like_regexp(
+                            "blueprints/lambdas/sagemaker_layer\\.[0-9a-f]{12}\\.zip"
+                        ),
                     },
-                    "CompatibleRuntimes": ["python3.9", "python3.10"],
+                    "CompatibleRuntimes": ["python3.12"],
                 },
             )
 
@@ -349,16 +361,6 @@ class TestModelMonitor:
                     "PolicyDocument": {
                         "Statement": Match.array_with(
                             [
-                                {
-                                    "Action": "sts:AssumeRole",
-                                    "Effect": "Allow",
-                                    "Resource": {
-                                        "Fn::GetAtt": [
-                                            "createbaselinesagemakerroleEF4D9DF2",
-                                            "Arn",
-                                        ]
-                                    },
-                                },
                                 {
                                     "Action": [
                                         "sagemaker:CreateProcessingJob",
@@ -496,7 +498,7 @@ class TestModelMonitor:
                         "Version": "2012-10-17",
                     },
                     "PolicyName": Match.string_like_regexp(
-                        "createbaselinesagemakerroleDefaultPolicy*"
+                        "createbaselinesagemakerrolePolicy*"
                     ),
                     "Roles": [
                         {
@@ -508,6 +510,17 @@ class TestModelMonitor:
                 },
             )
 
+    def test_create_baseline_role_no_self_assume(self):
+        """Tests the SageMaker role's policies do not grant it to assume itself"""
+        for template in self.templates:
+            policies = template.find_resources("AWS::IAM::Policy")
+            actions = [
+                statement["Action"]
+                for policy in policies.values()
+                for statement in policy["Properties"]["PolicyDocument"]["Statement"]
+            ]
+            assert "sts:AssumeRole" not in actions
+
     def test_create_baseline_lambda_policy(self):
         """Tests for Create baseline Lambda policy"""
         for template in self.templates:
@@ -661,47 +674,62 @@ class TestModelMonitor:
                                         },
                                     ],
                                 },
-                                {
-                                    "Action": [
-                                        "logs:CreateLogStream",
-                                        "logs:PutLogEvents",
-                                    ],
-                                    "Effect": "Allow",
-                                    "Resource": [
-                                        {
-                                            "Fn::Join": [
-                                                "",
-                                                [
-                                                    "arn:",
-                                                    {"Ref": "AWS::Partition"},
-                                                    ":logs:",
-                                                    {"Ref": "AWS::Region"},
-                                                    ":",
-                                                    {"Ref": "AWS::AccountId"},
-                                                    ":log-group:/aws/lambda/*",
-                                                ],
-                                            ]
-                                        },
-                                        {
-                                            "Fn::Join": [
-                                                "",
-                                                [
-                                                    "arn:",
-                                                    {"Ref": "AWS::Partition"},
-                                                    ":logs:",
-                                                    {"Ref": "AWS::Region"},
-                                                    ":",
-                                                    {"Ref": "AWS::AccountId"},
-                                                    ":log-group:*:log-stream:*",
-                                                ],
-                                            ]
-                                        },
-                                    ],
-                                },
-                                {
-                                    "Action": "logs:CreateLogGroup",
-                                    "Effect": "Allow",
-                                    "Resource": {
+                            ]
+                        ),
+                        "Version": "2012-10-17",
+                    },
+                    "PolicyName": Match.string_like_regexp(
+                        "createbaselinejoblambdarolePolicy*"
+                    ),
+                    "Roles": [
+                        {
+                            "Ref": Match.string_like_regexp(
+                                "createbaselinejoblambdarole*"
+                            )
+                        }
+                    ],
+                },
+            )
+
+    def test_lambda_logs_policy(self):
+        """Tests for the lambda logs policy shared by the stack's functions"""
+        for template in self.templates:
+            template.resource_count_is("AWS::IAM::ManagedPolicy", 0)
+            template.has_resource(
+                "AWS::IAM::Policy",
+                {
+                    "Properties": {
+                        "PolicyName": Match.string_like_regexp("LambdaLogsPolicy*"),
+                        "Roles": [
+                            {
+                                "Ref": Match.string_like_regexp(
+                                    "createbaselinejoblambdarole*"
+                                )
+                            }
+                        ],
+                    },
+                    "Metadata": {
+                        "cfn_nag": {
+                            "rules_to_suppress": [
+                                {"id": "W12", "reason": Match.any_value()}
+                            ]
+                        }
+                    },
+                },
+            )
+            template.has_resource_properties(
+                "AWS::IAM::Policy",
+                {
+                    "PolicyDocument": {
+                        "Statement": [
+                            {
+                                "Action": [
+                                    "logs:CreateLogStream",
+                                    "logs:PutLogEvents",
+                                ],
+                                "Effect": "Allow",
+                                "Resource": [
+                                    {
                                         "Fn::Join": [
                                             "",
                                             [
@@ -711,25 +739,48 @@ class TestModelMonitor:
                                                 {"Ref": "AWS::Region"},
                                                 ":",
                                                 {"Ref": "AWS::AccountId"},
-                                                ":*",
+                                                ":log-group:/aws/lambda/*",
+                                            ],
+                                        ]
+                                    },
+                                    {
+                                        "Fn::Join": [
+                                            "",
+                                            [
+                                                "arn:",
+                                                {"Ref": "AWS::Partition"},
+                                                ":logs:",
+                                                {"Ref": "AWS::Region"},
+                                                ":",
+                                                {"Ref": "AWS::AccountId"},
+                                                ":log-group:*:log-stream:*",
                                             ],
                                         ]
                                     },
+                                ],
+                            },
+                            {
+                                "Action": "logs:CreateLogGroup",
+                                "Effect": "Allow",
+                                "Resource": {
+                                    "Fn::Join": [
+                                        "",
+                                        [
+                                            "arn:",
+                                            {"Ref": "AWS::Partition"},
+                                            ":logs:",
+                                            {"Ref": "AWS::Region"},
+                                            ":",
+                                            {"Ref": "AWS::AccountId"},
+                                            ":*",
+                                        ],
+                                    ]
                                 },
-                            ]
-                        ),
+                            },
+                        ],
                         "Version": "2012-10-17",
                     },
-                    "PolicyName": Match.string_like_regexp(
-                        "createbaselinejoblambdaroleDefaultPolicy*"
-                    ),
-                    "Roles": [
-                        {
-                            "Ref": Match.string_like_regexp(
-                                "createbaselinejoblambdarole*"
-                            )
-                        }
-                    ],
+                    "PolicyName": Match.string_like_regexp("LambdaLogsPolicy*"),
                 },
             )
 
@@ -741,7 +792,9 @@ class TestModelMonitor:
                 {
                     "Code": {
                         "S3Bucket": {"Ref": "BlueprintBucket"},
-                        "S3Key": "blueprints/lambdas/create_baseline_job.zip",
+                        "S3Key": Match.string_like_regexp(
+                            "blueprints/lambdas/create_baseline_job\\.[0-9a-f]{12}\\.zip"
+                        ),
                     },
                     "Role": {
                         "Fn::GetAtt": ["createbaselinejoblambdaroleA17644CE", "Arn"]
@@ -785,7 +838,8 @@ class TestModelMonitor:
                     },
                     "Handler": "main.handler",
                     "Layers": [{"Ref": Match.string_like_regexp("sagemakerlayer*")}],
-                    "Runtime": "python3.10",
+                    "MemorySize": {"Ref": "LambdaMemorySize"},
+                    "Runtime": "python3.12",
                     "Timeout": 600,
                 },
             )
@@ -794,10 +848,9 @@ class TestModelMonitor:
                 "AWS::Lambda::Function",
                 {
                     "DependsOn": [
-                        Match.string_like_regexp(
-                            "createbaselinejoblambdaroleDefaultPolicy*"
-                        ),
                         Match.string_like_regexp("createbaselinejoblambdarole*"),
+                        Match.string_like_regexp("createbaselinejoblambdarolePolicy*"),
+                        Match.string_like_regexp("LambdaLogsPolicy*"),
                     ]
                 },
             )
@@ -901,6 +954,11 @@ class TestModelMonitor:
                 },
             )
 
+            # the function is invoked at $LATEST, so a stack update that only changes parameters (e.g., the
+            # baseline settings, or LambdaMemorySize) is picked up by the next invocation
+            template.resource_count_is("AWS::Lambda::Version", 0)
+            template.resource_count_is("AWS::Lambda::Alias", 0)
+
     def test_data_quality_job_definition(self):
         """Test Data Quality Job Definition"""
         self.data_quality_template.has_resource_properties(
@@ -373,9 +373,11 @@ class TestModelTraining:
                 {
                     "Content": {
                         "S3Bucket": {"Ref": "BlueprintBucket"},
-                        "S3Key": "blueprints/lambdas/sagemaker_layer.zip",
+                        "S3Key": Match.string_like_regexp(
+                            "blueprints/lambdas/sagemaker_layer\\.[0-9a-f]{12}\\.zip"
+                        ),
                     },
-                    "CompatibleRuntimes": ["python3.9", "python3.10"],
+                    "CompatibleRuntimes": ["python3.12"],
                 },
             )
 
@@ -468,18 +470,6 @@ class TestModelTraining:
                                         ]
                                     },
                                 },
-                                {
-                                    "Action": "sts:AssumeRole",
-                                    "Effect": "Allow",
-                                    "Resource": {
-                                        "Fn::GetAtt": [
-                                            Match.string_like_regexp(
-                                                "createtrainingjobsagemakerrole*"
-                                            ),
-                                            "Arn",
-                                        ]
-                                    },
-                                },
                             ]
                         ),
                         "Version": "2012-10-17",
@@ -539,7 +529,9 @@ class TestModelTraining:
                 {
                     "Code": {
                         "S3Bucket": {"Ref": "BlueprintBucket"},
-                        "S3Key": "blueprints/lambdas/create_model_training_job.zip",
+                        "S3Key": Match.string_like_regexp(
+                            "blueprints/lambdas/create_model_training_job\\.[0-9a-f]{12}\\.zip"
+                        ),
                     },
                     "Role": {
                         "Fn::GetAtt": [
@@ -621,7 +613,7 @@ class TestModelTraining:
                     },
                     "Handler": "main.handler",
                     "Layers": [{"Ref": Match.string_like_regexp("sagemakerlayer*")}],
-                    "Runtime": "python3.10",
+                    "Runtime": "python3.12",
                     "Timeout": 600,
                 },
             )
@@ -630,6 +622,7 @@ class TestModelTraining:
                 "AWS::Lambda::Function",
                 {
                     "DependsOn": [
+                        Match.string_like_regexp("LambdaLogsPolicy*"),
                         Match.string_like_regexp("trainingjoblambdaroleDefaultPolicy*"),
                         Match.string_like_regexp("trainingjoblambdarole*"),
                     ]
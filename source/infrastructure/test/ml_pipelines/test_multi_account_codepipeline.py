@@ -191,6 +191,18 @@ class TestMultiAccountCodePipelineStack:
                 "Description": "Is a delegated administrator account used to deploy across account",
             },
         )
+        self.template.has_parameter(
+            "ProvisionedConcurrency",
+            {
+                "Type": "String",
+                "Default": "No",
+                "AllowedValues": ["Yes", "No"],
+                "Description": (
+                    "Keep one provisioned (warm) instance of each StackSet lambda function, and reserve one "
+                    "concurrent execution for it. The account must have enough unreserved concurrency left"
+                ),
+            },
+        )
 
     def test_template_conditions(self):
         """Tests for templates conditions"""
@@ -198,6 +210,10 @@ class TestMultiAccountCodePipelineStack:
             "UseDelegatedAdmin",
             {"Fn::Equals": [{"Ref": "DelegatedAdminAccount"}, "Yes"]},
         )
+        self.template.has_condition(
+            "UseProvisionedConcurrency",
+            {"Fn::Equals": [{"Ref": "ProvisionedConcurrency"}, "Yes"]},
+        )
 
     def test_all_s3_buckets_properties(self):
         """Tests for S3 buckets properties"""
@@ -456,6 +472,98 @@ class TestMultiAccountCodePipelineStack:
             },
         )
 
+    def test_stackset_lambdas_role(self):
+        """Tests each StackSet lambda function has its own role, scoped to its stage's StackSet"""
+        self.template.resource_count_is("AWS::IAM::ManagedPolicy", 0)
+        # one lambda function, role and delegated admin policy per deployment stage
+        self.template.resource_count_is("AWS::Lambda::Function", 3)
+        # the stages' roles share one lambda logs policy
+        self.template.has_resource_properties(
+            "AWS::IAM::Policy",
+            {
+                "PolicyName": Match.string_like_regexp("LambdaLogsPolicy*"),
+                "Roles": [
+                    {"Ref": Match.string_like_regexp(f"Deploy{stage}StackSetrole*")}
+                    for stage in ["Dev", "Staging", "Prod"]
+                ],
+            },
+        )
+        for stage in ["Dev", "Staging", "Prod"]:
+            self.template.has_resource_properties(
+                "AWS::Lambda::Function",
+                {
+                    "Role": {
+                        "Fn::GetAtt": [
+                            Match.string_like_regexp(f"Deploy{stage}StackSetrole*"),
+                            "Arn",
+                        ]
+                    },
+                },
+            )
+            self.template.has_resource(
+                "AWS::IAM::Policy",
+                {
+                    "Properties": {
+                        "Roles": [
+                            {
+                                "Ref": Match.string_like_regexp(
+                                    f"Deploy{stage}StackSetrole*"
+                                )
+                            }
+                        ],
+                        "PolicyName": Match.string_like_regexp(
+                            f"Deploy{stage}StackSetDelegatedAdminPolicy*"
+                        ),
+                    },
+                    "Condition": "UseDelegatedAdmin",
+                },
+            )
+
+    def test_stackset_lambdas_alias(self):
+        """Tests for the StackSet lambda functions' aliases invoked by the pipeline"""
+        self.template.resource_count_is("AWS::Lambda::Alias", 3)
+        self.template.all_resources_properties(
+            "AWS::Lambda::Alias",
+            {
+                "Name": "live",
+                # only provisioned when the ProvisionedConcurrency parameter is "Yes"
+                "ProvisionedConcurrencyConfig": {
+                    "Fn::If": [
+                        "UseProvisionedConcurrency",
+                        {"ProvisionedConcurrentExecutions": 1},
+                        {"Ref": "AWS::NoValue"},
+                    ]
+                },
+            },
+        )
+        self.template.all_resources_properties(
+            "AWS::Lambda::Function",
+            {
+                "ReservedConcurrentExecutions": {
+                    "Fn::If": [
+                        "UseProvisionedConcurrency",
+                        1,
+                        {"Ref": "AWS::NoValue"},
+                    ]
+                }
+            },
+        )
+
+    def test_stackset_lambdas_version(self):
+        """Tests a stack update that changes CALL_AS publishes a new version of the StackSet lambda functions"""
+        # a Version's properties cannot be updated, so a new description (i.e., a new DelegatedAdminAccount value)
+        # replaces it with a new version of the function's updated configuration, which the alias then points to
+        call_as = {"Fn::If": ["UseDelegatedAdmin", "DELEGATED_ADMIN", "SELF"]}
+        self.template.resource_count_is("AWS::Lambda::Version", 3)
+        self.template.all_resources_properties(
+            "AWS::Lambda::Version",
+            {"Description": {"Fn::Join": ["", ["CALL_AS: ", call_as]]}},
+        )
+        self.template.all_resources_properties(
+            "AWS::Lambda::Function",
+            {"Environment": {"Variables": {"CALL_AS": call_as}}},
+        )
+
     def test_codepipeline(self):
         """Tests for CodePipeline"""
         # assert there is one codepipeline
@@ -513,9 +621,27 @@ class TestMultiAccountCodePipelineStack:
                                 },
                                 "Configuration": {
                                     "FunctionName": {
-                                        "Ref": Match.string_like_regexp(
-                                            "DeployDevStackSetstacksetlambda*"
-                                        )
+                                        "Fn::Join": [
+                                            "",
+                                            [
+                                                {
+                                                    "Fn::Select": [
+                                                        6,
+                                                        {
+                                                            "Fn::Split": [
+                                                                ":",
+                                                                {
+                                                                    "Ref": Match.string_like_regexp(
+                                                                        "DeployDevStackSetstacksetlambdaAliaslive*"
+                                                                    )
+                                                                },
+                                                            ]
+                                                        },
+                                                    ]
+                                                },
+                                                ":live",
+                                            ],
+                                        ]
                                     },
                                     "UserParameters": {
                                         "Fn::Join": [
@@ -615,9 +741,27 @@ class TestMultiAccountCodePipelineStack:
                                 },
                                 "Configuration": {
                                     "FunctionName": {
-                                        "Ref": Match.string_like_regexp(
-                                            "DeployStagingStackSetstacksetlambda*"
-                                        )
+                                        "Fn::Join": [
+                                            "",
+                                            [
+                                                {
+                                                    "Fn::Select": [
+                                                        6,
+                                                        {
+                                                            "Fn::Split": [
+                                                                ":",
+                                                                {
+                                                                    "Ref": Match.string_like_regexp(
+                                                                        "DeployStagingStackSetstacksetlambdaAliaslive*"
+                                                                    )
+                                                                },
+                                                            ]
+                                                        },
+                                                    ]
+                                                },
+                                                ":live",
+                                            ],
+                                        ]
                                     },
                                     "UserParameters": {
                                         "Fn::Join": [
@@ -717,9 +861,27 @@ class TestMultiAccountCodePipelineStack:
                                 },
                                 "Configuration": {
                                     "FunctionName": {
-                                        "Ref": Match.string_like_regexp(
-                                            "DeployProdStackSetstacksetlambda*"
-                                        )
+                                        "Fn::Join": [
+                                            "",
+                                            [
+                                                {
+                                                    "Fn::Select": [
+                                                        6,
+                                                        {
+                                                            "Fn::Split": [
+                                                                ":",
+                                                                {
+                                                                    "Ref": Match.string_like_regexp(
+                                                                        "DeployProdStackSetstacksetlambdaAliaslive*"
+                                                                    )
+                                                                },
+                                                            ]
+                                                        },
+                                                    ]
+                                                },
+                                                ":live",
+                                            ],
+                                        ]
                                     },
                                     "UserParameters": {
                                         "Fn::Join": [
@@ -0,0 +1,189 @@
+# #####################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                 #
+#                                                                                                                     #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance     #
+#  with the License. A copy of the License is located at                                                              #
+#                                                                                                                     #
+#  http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                     #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES  #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
+#  and limitations under the License.                                                                                 #
+# #####################################################################################################################
+import os
+import re
+import subprocess
+import sys
+import pytest
+import aws_cdk as cdk
+from aws_cdk import aws_s3 as s3
+from aws_cdk.assertions import Template
+from lib.blueprints.pipeline_definitions import deploy_actions
+from lib.blueprints.pipeline_definitions.deploy_actions import (
+    batch_transform,
+    blueprint_lambda_key,
+    blueprint_lambda_keys,
+    create_invoke_lambda_custom_resource,
+    sagemaker_layer,
+)
+
+infrastructure_dir = os.path.join(os.path.dirname(__file__), "..", "..")
+build_script = os.path.join(
+    infrastructure_dir, "..", "..", "deployment", "build-s3-dist.sh"
+)
+
+
+@pytest.fixture
+def stack():
+    return cdk.Stack(cdk.App(), "DeployActionsStack")
+
+
+@pytest.fixture
+def blueprint_bucket(stack):
+    return s3.Bucket.from_bucket_name(stack, "BlueprintBucket", "blueprint-bucket")
+
+
+def test_shared_sagemaker_layer(stack, blueprint_bucket):
+    """Tests the pipelines created in the same stack share one SageMaker layer"""
+    assert sagemaker_layer(stack, blueprint_bucket) is sagemaker_layer(
+        stack, blueprint_bucket
+    )
+    Template.from_stack(stack).resource_count_is("AWS::Lambda::LayerVersion", 1)
+
+
+def test_shared_invoke_lambda(stack, blueprint_bucket):
+    """Tests the custom resources of a stack share one Invoke Lambda function"""
+    for name in ["first", "second"]:
+        create_invoke_lambda_custom_resource(
+            stack,
+            f"Invoke{name}Lambda",
+            f"arn:aws:lambda:us-east-1:111111111111:function:{name}",
+            name,
+            blueprint_bucket,
+            {"Resource": "InvokeLambda"},
+        )
+    template = Template.from_stack(stack)
+
+    template.resource_count_is("AWS::Lambda::Function", 1)
+    template.resource_count_is("Custom::InvokeLambda", 2)
+    template.has_resource_properties(
+        "AWS::IAM::Policy",
+        {
+            "PolicyDocument": {
+                "Statement": [
+                    {
+                        "Action": "lambda:InvokeFunction",
+                        "Effect": "Allow",
+                        "Resource": [
+                            "arn:aws:lambda:us-east-1:111111111111:function:first",
+                            "arn:aws:lambda:us-east-1:111111111111:function:second",
+                        ],
+                    }
+                ],
+                "Version": "2012-10-17",
+            }
+        },
+    )
+
+
+def test_invoked_lambda_memory_size(stack, blueprint_bucket):
+    """Tests the LambdaMemorySize parameter is set on the function ($LATEST) the custom resource invokes"""
+    memory_size = cdk.CfnParameter(stack, "LambdaMemorySize", type="Number")
+    assets_bucket = s3.Bucket.from_bucket_name(stack, "AssetsBucket", "assets-bucket")
+    batch_lambda = batch_transform(
+        stack,
+        "BatchTransformLambda",
+        blueprint_bucket,
+        assets_bucket,
+        "model",
+        "ml.m5.large",
+        "input-bucket",
+        "input-bucket/data.csv",
+        "output-bucket/output",
+        "",
+        sagemaker_layer(stack, blueprint_bucket),
+        memory_size=memory_size.value_as_number,
+    )
+    create_invoke_lambda_custom_resource(
+        stack,
+        "InvokeBatchLambda",
+        batch_lambda.function_arn,
+        batch_lambda.function_name,
+        blueprint_bucket,
+        {"Resource": "InvokeLambda"},
+    )
+    template = Template.from_stack(stack)
+    batch_lambda_id = stack.get_logical_id(batch_lambda.node.default_child)
+
+    # an update of the parameter changes the function's configuration, which the next invocation uses
+    template.has_resource_properties(
+        "AWS::Lambda::Function", {"MemorySize": {"Ref": "LambdaMemorySize"}}
+    )
+    template.has_resource_properties(
+        "Custom::InvokeLambda", {"function_name": {"Ref": batch_lambda_id}}
+    )
+    template.resource_count_is("AWS::Lambda::Version", 0)
+
+
+def test_blueprint_lambda_key(tmp_path, monkeypatch):
+    """Tests the lambda's S3 key changes with its packaged content only"""
+    (tmp_path / "shared").mkdir()
+    (tmp_path / "shared" / "helper.py").write_text("shared = True")
+    lambda_dir = tmp_path / "lambdas" / "batch_transform"
+    lambda_dir.mkdir(parents=True)
+    (lambda_dir / "main.py").write_text("handler = None")
+    monkeypatch.setattr(
+        deploy_actions, "blueprint_lambdas_dir", str(tmp_path / "lambdas")
+    )
+    monkeypatch.setattr(deploy_actions, "shared_code_dir", str(tmp_path / "shared"))
+
+    def key():
+        deploy_actions.blueprint_lambda_key.cache_clear()
+        return deploy_actions.blueprint_lambda_key("batch_transform")
+
+    initial_key = key()
+    assert re.fullmatch(
+        r"blueprints/lambdas/batch_transform\.[0-9a-f]{12}\.zip", initial_key
+    )
+    # caches and tests are not packaged
+    (lambda_dir / "__pycache__").mkdir()
+    (lambda_dir / "__pycache__" / "main.cpython-312.pyc").write_bytes(b"0")
+    (lambda_dir / "tests").mkdir()
+    (lambda_dir / "tests" / "test_main.py").write_text("assert True")
+    # neither are the files the build script removes
+    (lambda_dir / "setup.py").write_text("setup()")
+    (lambda_dir / "requirements-test.txt").write_text("pytest")
+    assert key() == initial_key
+    # the function's code, and the shared code, are packaged
+    (lambda_dir / "main.py").write_text("handler = print")
+    changed_key = key()
+    assert changed_key != initial_key
+    (tmp_path / "shared" / "helper.py").write_text("shared = False")
+    assert key() != changed_key
+    deploy_actions.blueprint_lambda_key.cache_clear()
+
+
+def test_build_script_zip_file_name():
+    """Tests the build script names a lambda's zip file with the key referenced by the templates"""
+    with open(build_script) as f:
+        (zip_file_name_command,) = re.findall(
+            r"^\s*zip_file_name=`(.*)`$", f.read(), flags=re.M
+        )
+    # run the script's command, with the same variables, and the tests' python as python3
+    zip_file_name = subprocess.run(
+        ["bash", "-c", zip_file_name_command],
+        env={
+            **os.environ,
+            "PATH": f"{os.path.dirname(sys.executable)}{os.pathsep}{os.environ['PATH']}",
+            "source_dir": os.path.join(infrastructure_dir, ".."),
+            "lambda_dir_name": "batch_transform",
+        },
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+    assert f"blueprints/lambdas/{zip_file_name}.zip" == blueprint_lambda_key(
+        "batch_transform"
+    )
+    assert blueprint_lambda_key("batch_transform") in blueprint_lambda_keys()
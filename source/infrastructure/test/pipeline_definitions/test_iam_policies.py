@@ -0,0 +1,148 @@
+# #####################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                 #
+#                                                                                                                     #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance     #
+#  with the License. A copy of the License is located at                                                              #
+#                                                                                                                     #
+#  http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                     #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES  #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
+#  and limitations under the License.                                                                                 #
+# #####################################################################################################################
+import pytest
+import aws_cdk as cdk
+from aws_cdk import aws_iam as iam
+from lib.blueprints.pipeline_definitions.iam_policies import PolicyBuilder
+
+
+@pytest.fixture
+def stack():
+    return cdk.Stack(cdk.App(), "IamPoliciesStack")
+
+
+def resolved_statements(stack, builder):
+    return [
+        stack.resolve(statement.to_statement_json())
+        for statement in builder.statements()
+    ]
+
+
+def test_policy_builder_merges_same_actions(stack):
+    """Tests statements that only differ in their resources are merged, keeping the resources' order"""
+    builder = PolicyBuilder(
+        iam.PolicyStatement(actions=["s3:GetObject"], resources=["arn:aws:s3:::a/*"]),
+        iam.PolicyStatement(actions=["s3:PutObject"], resources=["arn:aws:s3:::a/*"]),
+    ).add(
+        iam.PolicyStatement(actions=["s3:GetObject"], resources=["arn:aws:s3:::b/*"]),
+        iam.PolicyStatement(actions=["s3:GetObject"], resources=["arn:aws:s3:::a/*"]),
+    )
+
+    assert resolved_statements(stack, builder) == [
+        {
+            "Action": "s3:GetObject",
+            "Effect": "Allow",
+            "Resource": ["arn:aws:s3:::a/*", "arn:aws:s3:::b/*"],
+        },
+        {
+            "Action": "s3:PutObject",
+            "Effect": "Allow",
+            "Resource": "arn:aws:s3:::a/*",
+        },
+    ]
+
+
+def test_policy_builder_keeps_unmergeable_statements(stack):
+    """Tests statements with a Sid, principals or a Deny effect are not merged with the others"""
+    statements = [
+        iam.PolicyStatement(actions=["s3:GetObject"], resources=["arn:aws:s3:::a/*"]),
+        iam.PolicyStatement(
+            sid="ReadB", actions=["s3:GetObject"], resources=["arn:aws:s3:::b/*"]
+        ),
+        iam.PolicyStatement(
+            actions=["s3:GetObject"],
+            resources=["arn:aws:s3:::c/*"],
+            principals=[iam.AccountPrincipal("111111111111")],
+        ),
+        iam.PolicyStatement(
+            effect=iam.Effect.DENY,
+            actions=["s3:GetObject"],
+            resources=["arn:aws:s3:::d/*"],
+        ),
+    ]
+    builder = PolicyBuilder(*statements)
+
+    assert len(builder.statements()) == 4
+    assert resolved_statements(stack, builder) == [
+        stack.resolve(statement.to_statement_json())
+        for statement in [statements[0], statements[3], statements[1], statements[2]]
+    ]
+
+
+def test_policy_builder_groups_by_conditions(stack):
+    """Tests statements are only merged with the statements that have the same conditions"""
+    kms_condition = {"StringEquals": {"kms:ViaService": "s3.us-east-1.amazonaws.com"}}
+    builder = PolicyBuilder(
+        iam.PolicyStatement(
+            actions=["kms:Decrypt"], resources=["key-a"], conditions=kms_condition
+        ),
+        iam.PolicyStatement(actions=["kms:Decrypt"], resources=["key-b"]),
+        iam.PolicyStatement(
+            actions=["kms:Decrypt"],
+            resources=["key-c"],
+            conditions={
+                "StringEquals": {"kms:ViaService": "s3.us-east-1.amazonaws.com"}
+            },
+        ),
+    )
+
+    assert resolved_statements(stack, builder) == [
+        {
+            "Action": "kms:Decrypt",
+            "Condition": kms_condition,
+            "Effect": "Allow",
+            "Resource": ["key-a", "key-c"],
+        },
+        {"Action": "kms:Decrypt", "Effect": "Allow", "Resource": "key-b"},
+    ]
+
+
+def test_policy_builder_token_conditions(stack):
+    """Tests conditions with unresolved tokens are merged by token, and rendered as-is"""
+    has_vpc = cdk.CfnCondition(
+        stack,
+        "HasVpc",
+        expression=cdk.Fn.condition_equals(cdk.Aws.REGION, "us-east-1"),
+    )
+    vpc_condition = {
+        "StringEquals": {
+            "aws:SourceVpc": cdk.Fn.condition_if(
+                has_vpc.logical_id, "vpc-1", cdk.Aws.NO_VALUE
+            )
+        }
+    }
+    builder = PolicyBuilder(
+        iam.PolicyStatement(
+            actions=["s3:GetObject"], resources=["a"], conditions=vpc_condition
+        ),
+        iam.PolicyStatement(
+            actions=["s3:GetObject"], resources=["b"], conditions=vpc_condition
+        ),
+        iam.PolicyStatement(actions=["s3:GetObject"], resources=["c"]),
+    )
+
+    assert resolved_statements(stack, builder) == [
+        {
+            "Action": "s3:GetObject",
+            "Condition": {
+                "StringEquals": {
+                    "aws:SourceVpc": {
+                        "Fn::If": ["HasVpc", "vpc-1", {"Ref": "AWS::NoValue"}]
+                    }
+                }
+            },
+            "Effect": "Allow",
+            "Resource": ["a", "b"],
+        },
+        {"Action": "s3:GetObject", "Effect": "Allow", "Resource": "c"},
+    ]
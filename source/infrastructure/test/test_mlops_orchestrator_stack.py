@@ -10,6 +10,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
+import re
 import aws_cdk as cdk
 from aws_cdk.assertions import Template, Match
 from lib.mlops_orchestrator_stack import MLOpsStack
@@ -305,6 +306,16 @@ class TestMLOpsStacks:
                 2,
             )
 
+    def test_s3_buckets_logical_ids(self):
+        """Tests the buckets' logical ids do not change between synthesis runs"""
+        for template in self.templates:
+            bucket_ids = template.find_resources("AWS::S3::Bucket").keys()
+            for prefix in ["pipelineassets", "blueprintrepository"]:
+                assert any(
+                    re.fullmatch(f"{prefix}[0-9A-F]{{8}}", bucket_id)
+                    for bucket_id in bucket_ids
+                )
+
     def test_all_s3_buckets_policy(self):
         """Tests for S3 buckets policies"""
         for template in self.templates:
@@ -693,7 +704,17 @@ class TestMLOpsStacks:
                             Match.string_like_regexp("CustomResourceLambda*"),
                             "Arn",
                         ]
-                    }
+                    },
+                    "blueprint_lambda_keys": Match.array_with(
+                        [
+                            Match.string_like_regexp(
+                                "blueprints/lambdas/batch_transform\\.[0-9a-f]{12}\\.zip"
+                            ),
+                            Match.string_like_regexp(
+                                "blueprints/lambdas/sagemaker_layer\\.[0-9a-f]{12}\\.zip"
+                            ),
+                        ]
+                    ),
                 },
             )
 
@@ -864,6 +885,17 @@ class TestMLOpsStacks:
                                     "lambda:RemovePermission",
                                     "lambda:UpdateFunctionConfiguration",
                                     "lambda:TagResource",
+                                    "lambda:PublishVersion",
+                                    "lambda:ListVersionsByFunction",
+                                    "lambda:CreateAlias",
+                                    "lambda:UpdateAlias",
+                                    "lambda:DeleteAlias",
+                                    "lambda:GetAlias",
+                                    "lambda:PutProvisionedConcurrencyConfig",
+                                    "lambda:GetProvisionedConcurrencyConfig",
+                                    "lambda:DeleteProvisionedConcurrencyConfig",
+                                    "lambda:PutFunctionConcurrency",
+                                    "lambda:DeleteFunctionConcurrency",
                                 ],
                                 "Effect": "Allow",
                                 "Resource": [
@@ -1378,9 +1410,11 @@ class TestMLOpsStacks:
                         "S3Bucket": {
                             "Ref": Match.string_like_regexp("blueprintrepository*")
                         },
-                        "S3Key": "blueprints/lambdas/sagemaker_layer.zip",
+                        "S3Key": Match.string_like_regexp(
+                            "blueprints/lambdas/sagemaker_layer\\.[0-9a-f]{12}\\.zip"
+                        ),
                     },
-                    "CompatibleRuntimes": ["python3.9", "python3.10"],
+                    "CompatibleRuntimes": ["python3.12"],
                 },
             )
             # assert layer's dependency
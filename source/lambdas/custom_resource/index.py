@@ -13,10 +13,12 @@
 import os
 import sys
 import shutil
+import hashlib
 import tempfile
 import logging
 import traceback
 import boto3
+from botocore.exceptions import ClientError
 from crhelper import CfnResource
 
 
@@ -26,6 +28,23 @@ s3_client = boto3.client("s3")
 helper = CfnResource(json_logging=True, log_level="INFO")
 
 
+def file_sha256(file_path):
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def is_uploaded(s3_client, bucket, s3_path, sha256):
+    # the uploaded objects carry the hash of their content in their metadata
+    try:
+        response = s3_client.head_object(Bucket=bucket, Key=s3_path)
+        return response["Metadata"].get("sha256") == sha256
+    except ClientError:
+        return False
+
+
 def copy_assets_to_s3(s3_client):
     # get the source/destination bukcets and file key
     s3_bucket_name = os.environ.get("SOURCE_BUCKET")
@@ -58,8 +77,15 @@ def copy_assets_to_s3(s3_client):
             # construct the full s3 path
             relative_path = os.path.relpath(local_path, local_directory)
             s3_path = os.path.join(base_dir, relative_path)
+
+            # skip the files that were not changed since the last copy (e.g., on solution's update)
+            sha256 = file_sha256(local_path)
+            if is_uploaded(s3_client, bucket, s3_path, sha256):
+                logger.info(f"Skipping unchanged {s3_path}...")
+                continue
+
             logger.info(f"Uploading {s3_path}...")
-            s3_client.upload_file(local_path, bucket, s3_path)
+            s3_client.upload_file(local_path, bucket, s3_path, ExtraArgs={"Metadata": {"sha256": sha256}})
 
     return "CopyAssets-" + bucket
 
@@ -69,6 +95,7 @@ def on_event(event, context):
 
 
 @helper.create
+@helper.update
 def custom_resource(event, _):
 
     try:
@@ -81,7 +108,6 @@ def custom_resource(event, _):
         raise e
 
 
-@helper.update
 @helper.delete
 def no_op(_, __):
     pass  # No action is required when stack is deleted
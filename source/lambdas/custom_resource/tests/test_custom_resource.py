@@ -11,6 +11,7 @@
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
 import os
+import shutil
 import boto3
 import tempfile
 import pytest
@@ -56,6 +57,27 @@ def test_copy_assets_to_s3(mocked_shutil, mocked_walk, mocked_response):
     assert copy_assets_to_s3(s3_client) == mocked_response
 
 
+@mock_s3
+def test_copy_assets_to_s3_skips_unchanged_files(mocked_response):
+    s3_client = boto3.client("s3", region_name="us-east-1")
+    s3_client.create_bucket(Bucket="solutions-bucket")
+    s3_client.create_bucket(Bucket="blueprints-bucket")
+    # create a blueprints.zip with one file
+    blueprints_dir = tempfile.mkdtemp()
+    os.makedirs(os.path.join(blueprints_dir, "blueprints", "lambdas"))
+    with open(os.path.join(blueprints_dir, "blueprints", "lambdas", "lambda.zip"), "w") as f:
+        f.write("lambda code")
+    zip_file = shutil.make_archive(os.path.join(tempfile.mkdtemp(), "blueprints"), "zip", blueprints_dir)
+    s3_client.upload_file(zip_file, os.environ["SOURCE_BUCKET"], os.environ["FILE_KEY"])
+
+    with patch.object(s3_client, "upload_file", wraps=s3_client.upload_file) as mocked_upload:
+        assert copy_assets_to_s3(s3_client) == mocked_response
+        mocked_upload.assert_called_once()
+        # assert the unchanged file is not uploaded again
+        assert copy_assets_to_s3(s3_client) == mocked_response
+        mocked_upload.assert_called_once()
+
+
 @patch("index.custom_resource")
 def test_no_op(mocked_custom, event):
     response = no_op(event, {})